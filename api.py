@@ -26,6 +26,10 @@ WSGIRequestHandler.protocol_version = "HTTP/1.1"
 # Create app using factory pattern (diyHue style)
 app: Flask = create_app(SERVER_CONFIG)
 
+# Background service threads, joined on shutdown instead of sleeping a fixed time
+_SHUTDOWN_GRACE: float = 2.0
+_service_threads: list[Thread] = []
+
 def run_http(bind_ip: str, host_ip: str, host_http_port: int) -> None:
     """Run the HTTP server"""
     logger.debug(f"Starting HTTP server on {bind_ip}:{host_http_port}")
@@ -38,15 +42,17 @@ def handle_exit(signum: int, frame: Any) -> None:
 
     # Stop all services immediately using threading events
     state_fetch.stop_all_services()
-
-    # Clean up specific services
-    state_fetch.disconnect_thermostats()
     scheduler.stop_scheduler()
     log_ws.stop_ws_server()
 
-    # Give threads a moment to exit gracefully
-    time.sleep(2)
+    # Let threads finish their current iteration, so no poll is still running during disconnect
+    deadline: float = time.monotonic() + _SHUTDOWN_GRACE
+    for thread in _service_threads:
+        thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+    state_fetch.disconnect_thermostats()
 
+    # The HTTP server still blocks the main thread, so leave without unwinding it
     os._exit(0)
 
 def setup_signal_handlers() -> None:
@@ -63,13 +69,16 @@ def main():
         host_http_port: int = getattr(SERVER_CONFIG, "httpPort", 5000)
         update_manager.startup_check()
 
-        Thread(target=state_fetch.sync_with_thermostats_threaded).start()
-        Thread(target=state_fetch.run_dht_service).start()
-        Thread(target=state_fetch.run_fan_service).start()
-        Thread(target=state_fetch.run_klok_service).start()
-        Thread(target=state_fetch.run_powerbutton_service).start()
-        Thread(target=scheduler.run_scheduler).start()
-        Thread(target=log_ws.start_ws_server).start()
+        for target in (state_fetch.sync_with_thermostats_threaded,
+                       state_fetch.run_dht_service,
+                       state_fetch.run_fan_service,
+                       state_fetch.run_klok_service,
+                       state_fetch.run_powerbutton_service,
+                       scheduler.run_scheduler,
+                       log_ws.start_ws_server):
+            thread: Thread = Thread(target=target)
+            thread.start()
+            _service_threads.append(thread)
         run_http(bind_ip, host_ip, host_http_port)
     except KeyboardInterrupt:
         logger.info("Received KeyboardInterrupt, shutting down gracefully...")
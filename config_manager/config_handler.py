@@ -47,16 +47,56 @@ def _open_yaml(path: str) -> Any:
     with open(path, 'r', encoding="utf-8") as fp:
         return yaml.load(fp, Loader=yaml.FullLoader)
 
+# (text, mtime_ns) last written per YAML path, so periodic saves of unchanged config do not rewrite the SD card
+_written_yaml: dict[str, tuple[str, int]] = {}
+
+def _umask_file_mode() -> int:
+    """Mode open() gives a new file under the current umask, which can only be read by setting it"""
+    umask: int = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# Read once at import, before the service threads start, since os.umask() is process-wide
+_NEW_FILE_MODE: int = _umask_file_mode()
+
 def _write_yaml(path: str, contents: Any) -> None:
     """
-    Write contents to a YAML file.
+    Write contents to a YAML file atomically, skipping the write when the file already holds them.
 
     Args:
         path (str): The path to the YAML file.
         contents (Any): The contents to write to the YAML file.
     """
-    with open(path, 'w', encoding="utf-8") as fp:
-        yaml.dump(contents, fp, Dumper=NoAliasDumper, allow_unicode=True, sort_keys=False)
+    text: str = yaml.dump(contents, Dumper=NoAliasDumper, allow_unicode=True, sort_keys=False)
+    written: tuple[str, int] | None = _written_yaml.get(path)
+    if written is not None and written[0] == text:
+        try:
+            # Only skip while the file is still the one written here, not restored or edited since
+            if os.stat(path).st_mtime_ns == written[1]:
+                return
+        except OSError:
+            pass
+    # Unique temp file next to the target, so concurrent saves never share one and the replace stays on one filesystem
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".")
+    try:
+        with os.fdopen(fd, 'w', encoding="utf-8") as fp:
+            # Keep the existing file's permissions; a new file gets the umask mode open() would give it, not mkstemp's 0600
+            try:
+                mode: int = os.stat(path).st_mode & 0o7777
+            except FileNotFoundError:
+                mode = _NEW_FILE_MODE
+            os.chmod(tmp_path, mode)
+            fp.write(text)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _written_yaml[path] = (text, os.stat(path).st_mtime_ns)
 
 class Config:
     """
@@ -231,9 +271,13 @@ class Config:
             logger.debug("No DHT object found, skipping callback setup")
             return
 
+        # The thermostats dict is updated in place, so one resolved reference stays live
+        thermostats: dict[str, ThermostatObject] = self.yaml_config["thermostats"]
+
         def handle_temperature_update(temperature: float) -> None:
             """Handle temperature updates from DHT sensor"""
-            for thermostat in self.yaml_config["thermostats"].values():
+            # Snapshot so routes adding/removing thermostats cannot break the iteration
+            for thermostat in tuple(thermostats.values()):
                 try:
                     thermostat: ThermostatObject = thermostat
                     thermostat.update_dht_related_status(temperature=temperature)
@@ -242,7 +286,8 @@ class Config:
 
         def handle_humidity_update(humidity: float) -> None:
             """Handle humidity updates from DHT sensor"""
-            for thermostat in self.yaml_config["thermostats"].values():
+            # Snapshot so routes adding/removing thermostats cannot break the iteration
+            for thermostat in tuple(thermostats.values()):
                 try:
                     thermostat: ThermostatObject = thermostat
                     thermostat.update_dht_related_status(humidity=humidity)
@@ -9,13 +9,13 @@ from typing import Any, cast
 from flask import Flask, Request
 from flask_cors import CORS
 from flask_restful import Api
-from werkzeug.security import check_password_hash
 import logManager
 import flask_login
 import config_manager
 from flask_ui.core import User  # dummy import for flask_login module
 from flask_ui.core.views import core
 from flask_ui.error_pages.handlers import error_pages
+from services.utils import verify_password
 from .system_routes import SystemRoute
 from .dht_routes import DHTRoute
 from .thermostat_routes import ThermostatRoute
@@ -54,10 +54,12 @@ def create_app(server_config) -> Flask:
 
     # Configuration
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', os.urandom(24))
-    app.config['RESTFUL_JSON'] = {'ensure_ascii': False}
+    app.config['RESTFUL_JSON'] = {'ensure_ascii': False, 'separators': (',', ':')}
+    app.json.sort_keys = False  # type: ignore[attr-defined]
 
     # CORS setup
-    CORS(app, resources={r"*": {"origins": "*"}})
+    # Only requests carrying an Origin header need CORS headers; same-origin polls skip them
+    CORS(app, resources={r"*": {"origins": "*"}}, always_send=False)
 
     # Flask-Login setup
     login_manager: flask_login.LoginManager = flask_login.LoginManager()
@@ -86,10 +88,7 @@ def create_app(server_config) -> Flask:
         user: User = User()
         setattr(user, "id", email)
         logger.info(f"Authentication attempt for user: {email}")
-        if not check_password_hash(
-            password,
-            server_config["config"]["users"][email]["password"]
-        ):
+        if not verify_password(server_config["config"]["users"][email]["password"], password):
             return None
         return user
 
@@ -32,7 +32,7 @@ class ConfigRoute(Resource):
         """
         try:
             put_dict: dict[str, Any] = request.get_json(force=True)
-            logger.debug(f"PUT request for resource: {resource}, data: {put_dict}")
+            logger.debug("PUT request for resource: %s, data: %s", resource, put_dict)
             if not put_dict:
                 return {"error": "No data provided"}, 400
 
@@ -57,13 +57,13 @@ class ConfigRoute(Resource):
             if "system" in put_dict:
                 if "loglevel" in put_dict["system"]:
                     log_changes = logManager.logger.configure_logger(put_dict["system"]["loglevel"])
-                    logger.info(f"Log level changed to {put_dict['system']['loglevel']}:")
+                    logger.info("Log level changed to %s:", put_dict['system']['loglevel'])
                     if log_changes == "No changes made to logger levels":
                         logger.warning("No changes made to log level")
                     else:
                         logger.debug("Log level changes:")
                         for change in log_changes:
-                            logger.debug(f"  - {change}")
+                            logger.debug("  - %s", change)
                     changes_made.append(f"changed log level to {put_dict['system']['loglevel']}")
 
                 if "branch" in put_dict["system"]:
@@ -84,7 +84,7 @@ class ConfigRoute(Resource):
             if changes_made:
                 try:
                     config_manager.SERVER_CONFIG.save_config(backup=False, resource="config")
-                    logger.info(f"Configuration updated - Changes: {', '.join(changes_made)}")
+                    logger.info("Configuration updated - Changes: %s", ', '.join(changes_made))
                     return {
                         "message": "Configuration updated successfully",
                         "changes": changes_made,
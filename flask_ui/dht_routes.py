@@ -50,7 +50,7 @@ class DHTRoute(Resource):
         """
             Handle GET requests for DHT sensor data
         """
-        logger.info(f"DHT GET request: resource: {resource}")
+        logger.info("DHT GET request: resource: %s", resource)
         dht: DHTObject | None = find_dht()
 
         if dht is None:
@@ -61,7 +61,7 @@ class DHTRoute(Resource):
             # Return DHT configuration info
             try:
                 dht_info: dict[str, Any] = dht.get_all_data()
-                logger.info(f"Returning DHT info: {dht_info}")
+                logger.debug("Returning DHT info: %s", dht_info)
                 return dht_info, 200
             except KeyError as e:
                 logger.error(f"KeyError: {e}")
@@ -85,7 +85,7 @@ class DHTRoute(Resource):
                 return get_default_sensor_data("DHT sensor data not available")
 
             logger.info("Returning DHT data")
-            logger.debug(f"Temperature: {temp}°C, Humidity: {hum}%, Pin: {pin}")
+            logger.debug("Temperature: %s°C, Humidity: %s%%, Pin: %s", temp, hum, pin)
 
             return {
                 "temperature": temp,
@@ -98,27 +98,38 @@ class DHTRoute(Resource):
         Update DHT sensor configuration
         """
         post_dict: dict[str, Any] = request.get_json(force=True) if request.get_data(as_text=True) != "" else {}
-        logger.info(f"POST data received: {post_dict}")
+        logger.info("POST data received: %s", post_dict)
 
         dht: DHTObject | None = find_dht()
 
         if dht:
             logger.info("DHT already exists, updating configuration")
-            allowed_attributes: set[str] = {
-                'dht_pin',
-                'sensor_type',
-                'MIN_DHT_TEMP',
-                'MAX_DHT_TEMP',
-                'MIN_HUMIDITY',
-                'MAX_HUMIDITY',
-                'DHT_TEMP_CHANGE_THRESHOLD',
-                'DHT_HUMIDITY_CHANGE_THRESHOLD'
+            # Config keys as saved and posted, mapped to the DHTObject attributes they set
+            allowed_attributes: dict[str, str] = {
+                'dht_pin': 'dht_pin',
+                'sensor_type': 'sensor_type',
+                'MIN_DHT_TEMP': 'min_dht_temp',
+                'MAX_DHT_TEMP': 'max_dht_temp',
+                'MIN_HUMIDITY': 'min_humidity',
+                'MAX_HUMIDITY': 'max_humidity',
+                'DHT_TEMP_CHANGE_THRESHOLD': 'dht_temp_change_threshold',
+                'DHT_HUMIDITY_CHANGE_THRESHOLD': 'dht_humidity_change_threshold',
+                'DHT_READ_RETRIES': 'dht_read_retries'
                 }
             for key, value in post_dict.items():
-                if key in allowed_attributes and hasattr(dht, key):
-                    setattr(dht, key, value)
-                elif key not in allowed_attributes:
+                attribute: str | None = allowed_attributes.get(key)
+                if attribute is None:
                     logger.warning(f"Attempted to set non-allowed attribute: {key}")
+                    continue
+                if attribute == 'dht_read_retries':
+                    # Range-clamped by refresh_static_data below
+                    try:
+                        value = int(value)
+                    except (TypeError, ValueError):
+                        logger.warning(f"Invalid DHT_READ_RETRIES value: {value}")
+                        continue
+                setattr(dht, attribute, value)
+            dht.refresh_static_data()
         else:
             logger.info("DHT not found, creating a new one")
             try:
@@ -132,9 +143,10 @@ class DHTRoute(Resource):
             return {"error": "DHT not found or failed to create DHT"}, 500
 
         try:
-            logger.info(f"Updated DHT configuration: {dht.save()}")
+            saved: dict[str, Any] = dht.save()
+            logger.info("Updated DHT configuration: %s", saved)
             config_manager.SERVER_CONFIG.save_config(backup=False, resource="dht")
-            return dht.save(), 200
+            return saved, 200
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
             return {"error": "Failed to save configuration"}, 500
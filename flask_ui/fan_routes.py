@@ -67,7 +67,7 @@ class FanRoute(Resource):
         - POST /fan/<fan_id> - update existing fan or create with given id
         """
         post_dict: dict[str, Any] = request.get_json(force=True) if request.get_data(as_text=True) != "" else {}
-        logger.info(f"POST data received: {post_dict}")
+        logger.info("POST data received: %s", post_dict)
 
         if fan_id is None:
             new_id: str = next_free_id(SERVER_CONFIG, "fan")
@@ -80,7 +80,7 @@ class FanRoute(Resource):
         else:
             fan_or_none: FanObject | None = find_fan(fan_id)
             if fan_or_none is None:
-                logger.info(f"Fan {fan_id} not found, creating a new one")
+                logger.info("Fan %s not found, creating a new one", fan_id)
                 try:
                     fan = create_fan(fan_id, post_dict)
                     SERVER_CONFIG["fan"][fan_id] = fan
@@ -88,7 +88,7 @@ class FanRoute(Resource):
                     logger.error(f"Failed to create fan: {e}")
                     return {"error": str(e)}, 400
             else:
-                logger.info(f"Fan {fan_id} exists, updating configuration")
+                logger.info("Fan %s exists, updating configuration", fan_id)
                 fan = fan_or_none
                 allowed_attributes: set[str] = {
                     'gpio_pin',
@@ -106,6 +106,7 @@ class FanRoute(Resource):
                         setattr(fan, key, value)
                     elif key not in allowed_attributes:
                         logger.warning(f"Attempted to set non-allowed attribute: {key}")
+                fan.refresh_static_data()
 
         try:
             config_manager.SERVER_CONFIG.save_config(backup=False, resource="fan")
@@ -66,7 +66,7 @@ class KlokRoute(Resource):
         # Get value from URL parameter or query string
         value_param: str | None = value if value is not None else request.args.get("value")
 
-        logger.info(f"Klok GET request: resource={resource}, value={value_param}")
+        logger.info("Klok GET request: resource=%s, value=%s", resource, value_param)
 
         # Get the klok service (assuming it's a single service like DHT)
         klok: KlokObject | None = find_klok()
@@ -110,7 +110,7 @@ class KlokRoute(Resource):
         URL: /klok
         """
         post_dict: dict[str, Any] = request.get_json(force=True) if request.get_data(as_text=True) != "" else {}
-        logger.info(f"POST data received: {post_dict}")
+        logger.info("POST data received: %s", post_dict)
 
         klok: KlokObject | None = find_klok()
 
@@ -142,9 +142,10 @@ class KlokRoute(Resource):
             return {"error": "Klok not found or failed to create klok"}, 500
 
         try:
-            logger.info(f"Updated klok configuration: {klok.save()}")
+            saved: dict[str, Any] = klok.save()
+            logger.info("Updated klok configuration: %s", saved)
             config_manager.SERVER_CONFIG.save_config(backup=False, resource="klok")
-            return klok.save(), 200
+            return saved, 200
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
             return {"error": "Failed to save configuration"}, 500
@@ -50,7 +50,7 @@ class PowerButtonRoute(Resource):
         Handle POST requests for powerbutton resources
         """
         post_dict: dict[str, Any] = request.get_json(force=True) if request.get_data(as_text=True) != "" else {}
-        logger.info(f"POST data received: {post_dict}")
+        logger.info("POST data received: %s", post_dict)
 
         power_button: PowerButtonObject | None = find_powerbutton()
 
@@ -85,9 +85,10 @@ class PowerButtonRoute(Resource):
             return {"error": "PowerButton not found or failed to create PowerButton"}, 500
 
         try:
-            logger.info(f"Updated PowerButton configuration: {power_button.save()}")
+            saved: dict[str, Any] = power_button.save()
+            logger.info("Updated PowerButton configuration: %s", saved)
             config_manager.SERVER_CONFIG.save_config(backup=False, resource="powerbutton")
-            return power_button.save(), 200
+            return saved, 200
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
             return {"error": "Failed to save configuration"}, 500
@@ -101,6 +102,8 @@ class PowerButtonRoute(Resource):
             try:
                 logger.info("Deleting PowerButton service")
                 del SERVER_CONFIG["powerbutton"]
+                # Drop the edge callback so a re-created button can register its own on the pin
+                power_button.cleanup()
                 config_manager.SERVER_CONFIG.save_config(backup=False, resource="powerbutton")
                 return {"success": True}, 200
             except Exception as e:
@@ -1,6 +1,8 @@
 """
 System and configuration routes
 """
+from functools import cache
+from time import monotonic
 from typing import Any
 import os
 import logging
@@ -19,6 +21,11 @@ logger: logging.Logger = logManager.logger.get_logger(__name__)
 
 SERVER_CONFIG: dict[str, Any] = config_manager.SERVER_CONFIG.yaml_config
 
+# Seconds a health payload is reused, so frequent probes do not rebuild it or log each time
+_HEALTH_TTL: float = 1.0
+# Last health payload and when it was built, rebound as one tuple
+_health_cache: dict[str, tuple[float, dict[str, Any]]] = {"last": (float("-inf"), {})}
+
 class SystemRoute(Resource):
     """
     Flask-RESTful resource for managing system information and configuration.
@@ -40,17 +47,9 @@ class SystemRoute(Resource):
         elif resource == "all":
             try:
                 response_data, status_code = _get_all_config()
-                uname = os.uname()
-                response_data["pi_temp"] = get_pi_temp() if uname.sysname == "Linux" else "Unsupported OS"
-
-                response_data["info"] = {
-                        "sysname": uname.sysname,
-                        "machine": uname.machine,
-                        "os_version": uname.version,
-                        "os_release": uname.release,
-                        "server": config_manager.SERVER_CONFIG.serverCreateTime,
-                        "webui": config_manager.SERVER_CONFIG.WebUICreateTime
-                    }
+                info: dict[str, str] = _get_system_info()
+                response_data["pi_temp"] = get_pi_temp() if info["sysname"] == "Linux" else "Unsupported OS"
+                response_data["info"] = dict(info)
                 response = response_data, status_code
             except Exception as e:
                 logger.error(f"Error getting all system info: {e}")
@@ -65,30 +64,47 @@ class SystemRoute(Resource):
             response = {"error": "Resource not found"}, 404
         return response
 
+@cache
+def _get_system_info() -> dict[str, str]:
+    """Return the host and build information, which is fixed for the life of the process"""
+    uname = os.uname()
+    return {
+        "sysname": uname.sysname,
+        "machine": uname.machine,
+        "os_version": uname.version,
+        "os_release": uname.release,
+        "server": config_manager.SERVER_CONFIG.serverCreateTime,
+        "webui": config_manager.SERVER_CONFIG.WebUICreateTime
+    }
+
 def health_check() -> tuple[dict[str, Any], int]:
     """Health check endpoint"""
+    now: float = monotonic()
+    built_at, payload = _health_cache["last"]
+    if now - built_at < _HEALTH_TTL:
+        return payload, 200
+
     dht_obj: DHTObject | None = SERVER_CONFIG.get("dht")
 
-    # Handle both dict and object cases for DHT
-    if hasattr(dht_obj, 'get_data'):
-        logger.info("DHT object found, retrieving data")
-        temp, humidity = dht_obj.get_data() if dht_obj and hasattr(dht_obj, 'get_data') else (None, None)
-        dht_pin: int | None = dht_obj.get_pin() if dht_obj and hasattr(dht_obj, 'get_pin') else None
+    # The DHT entry is missing or None until a sensor is configured
+    if isinstance(dht_obj, DHTObject):
+        temp, humidity = dht_obj.get_data()
+        dht_pin: int | None = dht_obj.get_pin()
     else:
         # Fallback if object not properly initialized
-        logger.info("DHT object not properly initialized")
-        temp: float | None = None
-        humidity: float | None = None
-        dht_pin: int | None = None
+        logger.debug("DHT object not properly initialized")
+        temp, humidity, dht_pin = None, None, None
 
-    return {
+    payload = {
         "status": "healthy",
         "version": "1.0.0",
         "thermostats_connected": len(SERVER_CONFIG.get("thermostats", {})),
         "dht_sensor_active": dht_pin is not None,
         "temperature_available": temp is not None,
         "humidity_available": humidity is not None
-    }, 200
+    }
+    _health_cache["last"] = (now, payload)
+    return payload, 200
 
 def _get_all_config() -> tuple[dict[str, Any], int]:
     """Return the server configuration"""
@@ -116,7 +132,7 @@ def _get_thermostat_config() -> dict[str, Any] | str:
         if len(thermostats) > 0:
             for key, obj in thermostats.items():
                 if isinstance(obj, ThermostatObject):
-                    thermostats_data.update({key: obj.save()})
+                    thermostats_data[key] = obj.save()
         else:
             thermostats_data = "No Thermostats Configured"
         return thermostats_data
@@ -132,7 +148,7 @@ def _get_fan_config() -> dict[str, Any] | str:
         if len(fans) > 0:
             for fid, f in fans.items():
                 if isinstance(f, FanObject):
-                    fans_data.update({fid: f.save()})
+                    fans_data[fid] = f.save()
         else:
             fans_data = "No Fans Configured"
         return fans_data
@@ -4,7 +4,7 @@ HomeKit/Homebridge compatible routes
 import logging
 from typing import Any
 
-from flask import request
+from flask import Response, request
 from flask_restful import Resource
 from bleak.exc import BleakError
 
@@ -12,13 +12,16 @@ import logManager
 
 import config_manager
 
-from services.utils import validate_mac_address, format_mac, next_free_id, async_route
+from services.utils import normalize_mac, next_free_id, async_route
 from server_objects.thermostat_object import ThermostatObject
 
 logger: logging.Logger = logManager.logger.get_logger(__name__)
 
 SERVER_CONFIG: dict[str, Any] = config_manager.SERVER_CONFIG.yaml_config
 
+# HomeKit targetHeatingCoolingState values: 0 off, 1 heat, 2 cool, 3 auto
+_VALID_MODES: frozenset[str] = frozenset(('0', '1', '2', '3'))
+
 def find_thermostat(mac: str) -> ThermostatObject | None:
     """
     Find thermostat by MAC address
@@ -46,23 +49,25 @@ class ThermostatRoute(Resource):
     Flask-RESTful resource for managing thermostat configuration and control.
     """
     @async_route
-    async def get(self, mac: str, resource: str | None = None, value: str | None = None) -> tuple[dict[str, Any], int]:
+    async def get(self, mac: str, resource: str | None = None, value: str | None = None) -> tuple[dict[str, Any], int] | Response:
         """
         Handle GET requests for thermostat resources
         URL: /MAC_ADDRESS/ or /MAC_ADDRESS/resource
         """
-        if not validate_mac_address(mac):
+        normalized_mac: str | None = normalize_mac(mac)
+        if normalized_mac is None:
             return {"error": "Invalid MAC address format"}, 400
 
-        mac = format_mac(mac)
+        mac = normalized_mac
 
         thermostat: ThermostatObject | None = find_thermostat(mac)
         if not thermostat:
-            logger.info(f"Thermostat with MAC {mac} not found, creating a new one")
+            logger.info("Thermostat with MAC %s not found, creating a new one", mac)
             try:
                 thermostat = create_thermostat(mac)
                 SERVER_CONFIG["thermostats"][thermostat.id] = thermostat
-                logger.info(f"Created new thermostat with MAC {mac}: {thermostat.save()}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Created new thermostat with MAC %s: %s", mac, thermostat.save())
                 config_manager.SERVER_CONFIG.save_config(backup=False, resource="thermostats")
             except ValueError as e:
                 logger.error(f"Failed to create thermostat: {e}")
@@ -85,12 +90,14 @@ class ThermostatRoute(Resource):
             }, 200
 
         if resource == 'status':
-            return thermostat.get_status(), 200
+            return Response(thermostat.get_status_json(), mimetype="application/json")
 
         if resource == 'poll':
             try:
-                await thermostat.poll_status()
-                return thermostat.get_status(), 200
+                # Optional ?max_age=<seconds> serves a recent enough status without a BLE round-trip
+                max_age: float = request.args.get('max_age', default=0.0, type=float) or 0.0
+                await thermostat.poll_status(max_age=max_age)
+                return Response(thermostat.get_status_json(), mimetype="application/json")
             except BleakError:
                 logger.error(f"Device with address {mac} was not found")
                 return {"error": f"Device with address {mac} was not found"}, 404
@@ -109,8 +116,8 @@ class ThermostatRoute(Resource):
 
             try:
                 temperature: float = float(temp_value)
-                min_temp: float = getattr(thermostat, 'min_temperature', 5.0)
-                max_temp: float = getattr(thermostat, 'max_temperature', 35.0)
+                min_temp: float = thermostat.min_temperature
+                max_temp: float = thermostat.max_temperature
                 if not min_temp <= temperature <= max_temp:
                     return {
                         "error": f"Temperature must be between {min_temp}°C and {max_temp}°C"
@@ -119,7 +126,7 @@ class ThermostatRoute(Resource):
                 return {"error": "Invalid temperature value"}, 400
             try:
                 result: dict[str, Any] = await thermostat.set_temperature(str(temperature))
-                logger.info(f"HomeKit: Set targetTemperature for {mac} to {temperature}: {result}")
+                logger.info("HomeKit: Set targetTemperature for %s to %s: %s", mac, temperature, result)
 
                 if result["result"] == "ok":
                     return {"success": True, "temperature": temperature}, 200
@@ -137,12 +144,12 @@ class ThermostatRoute(Resource):
             if not mode_value:
                 return {"error": "Mode value is required as 'value' parameter"}, 400
 
-            if mode_value not in ['0', '1', '2', '3']:
+            if mode_value not in _VALID_MODES:
                 return {"error": "Mode must be 0 (off), 1 (heat), 2 (cool), or 3 (auto)"}, 400
 
             try:
                 result: dict[str, Any] = await thermostat.set_mode(mode_value)
-                logger.info(f"HomeKit: Set targetHeatingCoolingState for {mac} to {mode_value}: {result}")
+                logger.info("HomeKit: Set targetHeatingCoolingState for %s to %s: %s", mac, mode_value, result)
 
                 if result["result"] == "ok":
                     return {"success": True, "mode": int(mode_value)}, 200
@@ -160,22 +167,23 @@ class ThermostatRoute(Resource):
         Handle POST requests for thermostat resources
         URL: /MAC_ADDRESS/resource
         """
-        if not validate_mac_address(mac):
+        normalized_mac: str | None = normalize_mac(mac)
+        if normalized_mac is None:
             return {"error": "Invalid MAC address format"}, 400
 
-        mac = format_mac(mac)
+        mac = normalized_mac
 
         thermostat: ThermostatObject | None = find_thermostat(mac)
 
         post_dict: dict[str, Any] = request.get_json(force=True) if request.get_data(as_text=True) != "" else {}
-        logger.info(f"POST data received: {post_dict}")
+        logger.info("POST data received: %s", post_dict)
 
         # Validate required data for creating thermostat
         if not thermostat and not post_dict:
             return {"error": "JSON data required for creating new thermostat"}, 400
 
         if thermostat:
-            logger.info(f"Thermostat with MAC {mac} already exists, updating it")
+            logger.info("Thermostat with MAC %s already exists, updating it", mac)
             # Only allow updating certain safe attributes
             allowed_attributes: set[str] = {
                 'targetHeatingCoolingState',
@@ -189,7 +197,7 @@ class ThermostatRoute(Resource):
                 elif key not in allowed_attributes:
                     logger.warning(f"Attempted to set non-allowed attribute: {key}")
         else:
-            logger.info(f"Thermostat with MAC {mac} not found, creating a new one")
+            logger.info("Thermostat with MAC %s not found, creating a new one", mac)
             try:
                 thermostat = create_thermostat(mac, post_dict)
                 SERVER_CONFIG["thermostats"][thermostat.id] = thermostat
@@ -201,9 +209,10 @@ class ThermostatRoute(Resource):
             return {"error": f"Thermostat with MAC {mac} not found"}, 404
 
         try:
-            logger.info(f"Updated thermostat with MAC {mac}: {thermostat.save()}")
+            saved: dict[str, Any] = thermostat.save()
+            logger.info("Updated thermostat with MAC %s: %s", mac, saved)
             config_manager.SERVER_CONFIG.save_config(backup=False, resource="thermostats")
-            return thermostat.save(), 200
+            return saved, 200
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
             return {"error": "Failed to save configuration"}, 500
@@ -214,16 +223,17 @@ class ThermostatRoute(Resource):
         Handle DELETE requests for thermostat resources
         URL: /MAC_ADDRESS/resource
         """
-        if not validate_mac_address(mac):
+        normalized_mac: str | None = normalize_mac(mac)
+        if normalized_mac is None:
             return {"error": "Invalid MAC address format"}, 400
 
-        mac = format_mac(mac)
+        mac = normalized_mac
 
         thermostat: ThermostatObject | None = find_thermostat(mac)
 
         if thermostat:
             try:
-                logger.info(f"Deleting thermostat with MAC {mac}")
+                logger.info("Deleting thermostat with MAC %s", mac)
                 del SERVER_CONFIG["thermostats"][thermostat.id]
                 config_manager.SERVER_CONFIG.save_config(backup=False, resource="thermostats")
                 return {"success": True}, 200
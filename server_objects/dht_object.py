@@ -1,103 +1,287 @@
 """
 DHT sensor service for temperature and humidity monitoring
 """
-from threading import Lock
+from array import array
+from functools import cache
 import logging
+import threading
 from typing import Any, Callable, cast
-from time import sleep
+from time import monotonic, sleep
 
 import logManager
 
-try:
-    import adafruit_dht
-    import board
-except (ImportError, RuntimeError):
-    from services.dummy_import import DummyDHT as adafruit_dht
-    from services.dummy_import import DummyBoard as board
-
 logger: logging.Logger = logManager.logger.get_logger(__name__)
 
 TemperatureCallback = Callable[[float], None]
 HumidityCallback = Callable[[float], None]
 
+# Sensor types that map one-to-one onto adafruit_dht device classes
+_SUPPORTED_SENSORS: tuple[str, ...] = ("DHT22", "DHT11")
+
+# Lowercased error fragments of normal, transient DHT failures that are worth a retry
+_RETRY_ERRORS: tuple[str, ...] = ("checksum did not validate", "full buffer was not returned", "try again")
+# Log level for known non-retryable errors; anything else is logged as an error
+_ERROR_LEVELS: tuple[tuple[str, int], ...] = (
+    ("timed out", logging.WARNING),
+    ("device or resource busy", logging.WARNING),
+    ("permission", logging.ERROR),
+)
+
+# Bounds for the read retries of one reading: the attempt count, and the backoff delay between attempts
+_MAX_READ_RETRIES: int = 5
+_MAX_RETRY_DELAY: float = 10.0
+
+# Number of recent readings the median filter looks at; odd so the median is a real sample
+_MEDIAN_WINDOW: int = 5
+
+@cache
+def _load_dht_backend() -> tuple[Any, Any]:
+    """
+    Import the DHT backend on first use.
+    board probes the GPIO hardware on import, so processes without a DHT never pay for it.
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        import adafruit_dht
+        import board
+    except (ImportError, RuntimeError):
+        from services.dummy_import import DummyDHT as adafruit_dht
+        from services.dummy_import import DummyBoard as board
+    return adafruit_dht, board
+
+@cache
+def _board_pins() -> dict[int, Any]:
+    """Digital pins the board module exposes, keyed by GPIO number and scanned once"""
+    _, board = _load_dht_backend()
+    return {
+        int(name[1:]): getattr(board, name)
+        for name in dir(board)
+        if name.startswith("D") and name[1:].isdigit()
+    }
+
+def _to_deci(value: float) -> int:
+    """Convert a reading to integer tenths, rounding half away from zero"""
+    return int(value * 10 + (0.5 if value >= 0 else -0.5))
+
+def _significant_change(deci: int, latest_deci: int | None, last_logged_deci: int | None,
+                        threshold_deci: int) -> bool:
+    """Whether a valid reading moved far enough from the last notified one to be reported"""
+    if deci == latest_deci:
+        return False
+    if last_logged_deci is None:
+        # First reading
+        return True
+    delta: int = deci - last_logged_deci
+    return not -threshold_deci < delta < threshold_deci
+
+def _report_reading(name: str, unit: str, value: float | None, valid: bool, notify: bool,
+                    notify_callbacks: Callable[[float], None], debug_enabled: bool) -> None:
+    """Log a processed reading and notify its callbacks when it changed significantly"""
+    if not valid:
+        logger.error(f"{name.capitalize()} value not updated (None or out of range)")
+    elif notify:
+        logger.info(f"Updated {name}: {value}{unit}")
+        notify_callbacks(cast(float, value))
+    elif debug_enabled:
+        logger.debug("%s: %s%s", name.capitalize(), value, unit)
+
+class _MedianFilter:
+    """Median of the last few integer readings, to drop the DHT's occasional spurious sample"""
+    __slots__ = ("_ring", "_index", "_count")
+
+    def __init__(self) -> None:
+        self._ring: array[int] = array("i", [0] * _MEDIAN_WINDOW)
+        self._index: int = 0
+        self._count: int = 0
+
+    def push(self, value: int) -> int:
+        """Add a reading and return the median of the readings in the window"""
+        self._ring[self._index] = value
+        self._index = (self._index + 1) % _MEDIAN_WINDOW
+        if self._count < _MEDIAN_WINDOW:
+            self._count += 1
+        return sorted(self._ring[:self._count])[self._count // 2]
+
 class DHTObject:
     """
     DHT sensor service for reading temperature and humidity
     """
-    def __init__(self, data: dict[str, Any]) -> None:
-        self.sensor_type: str = data.get("sensor_type", "DHT22").upper()
-        if self.sensor_type not in ["DHT22", "DHT11"]:
-            logger.error(f"Unsupported DHT sensor type: {self.sensor_type}. Defaulting to DHT22.")
-            self.sensor_type = "DHT22"
+    __slots__ = (
+        "sensor_type",
+        "dht_pin",
+        "_latest_temp_deci",
+        "_latest_humidity_deci",
+        "_latest",
+        "temperature_callbacks",
+        "humidity_callbacks",
+        "min_dht_temp",
+        "max_dht_temp",
+        "min_humidity",
+        "max_humidity",
+        "dht_temp_change_threshold",
+        "dht_humidity_change_threshold",
+        "dht_read_retries",
+        "_last_logged_temp_deci",
+        "_last_logged_humidity_deci",
+        "_min_read_interval",
+        "_last_read_monotonic",
+        "dht_device",
+        "_device_lock",
+        "_device_config",
+        "_static_data",
+        "_all_data",
+        "_temp_threshold_deci",
+        "_humidity_threshold_deci",
+        "_temp_filter",
+        "_humidity_filter",
+    )
 
-        raw_dht_pin = data.get("dht_pin", None)
-        try:
-            self.dht_pin: int | None = int(raw_dht_pin) if raw_dht_pin is not None else None
-        except (TypeError, ValueError):
-            logger.error(f"Invalid dht_pin value: {raw_dht_pin}. Using None.")
-            self.dht_pin = None
+    def __init__(self, data: dict[str, Any]) -> None:
+        # Validated, together with any later update, when the device is set up in refresh_static_data
+        self.sensor_type: str = data.get("sensor_type", "DHT22")
+        self.dht_pin: int | None = data.get("dht_pin", None)
 
-        self.latest_temperature: float | None = cast(float | None, data.get("latest_temperature"))
-        self.latest_humidity: float | None = cast(float | None, data.get("latest_humidity"))
-        self.temperature_callbacks: list[TemperatureCallback] = []
-        self.humidity_callbacks: list[HumidityCallback] = []
+        # Readings are stored as integer tenths so change detection is an int compare
+        self._latest_temp_deci: int | None = None
+        self._latest_humidity_deci: int | None = None
+        # Published (temperature, humidity) pair; rebinding it is atomic so readers need no lock
+        self._latest: tuple[float | None, float | None] = (None, None)
+        self.latest_temperature = cast(float | None, data.get("latest_temperature"))
+        self.latest_humidity = cast(float | None, data.get("latest_humidity"))
+        # Immutable tuples, rebound on register, so notifying needs no lock
+        self.temperature_callbacks: tuple[TemperatureCallback, ...] = ()
+        self.humidity_callbacks: tuple[HumidityCallback, ...] = ()
         self.min_dht_temp: float = data.get("MIN_DHT_TEMP", -40.0)
         self.max_dht_temp: float = data.get("MAX_DHT_TEMP", 80.0)
         self.min_humidity: float = data.get("MIN_HUMIDITY", 0.0)
         self.max_humidity: float = data.get("MAX_HUMIDITY", 100.0)
         self.dht_temp_change_threshold: float = data.get("DHT_TEMP_CHANGE_THRESHOLD", 0.5)
         self.dht_humidity_change_threshold: float = data.get("DHT_HUMIDITY_CHANGE_THRESHOLD", 5.0)
-        self.dht_lock = Lock()
-        self.last_logged_dht_temp: float | None = None
-        self.last_logged_dht_humidity: float | None = None
-        self._thread_started = False
-        self.dht_device: Any
+        self.dht_read_retries: int = int(data.get("DHT_READ_RETRIES", 3))  # clamped in refresh_static_data
+        self._last_logged_temp_deci: int | None = None
+        self._last_logged_humidity_deci: int | None = None
+        self._min_read_interval: float = 2.0
+        self._last_read_monotonic: float | None = None
+        self.dht_device: Any = None
+        # Held around every sensor read and device rebuild; routes reconfigure while the DHT thread reads
+        self._device_lock = threading.Lock()
+        self._device_config: tuple[int | None, str] | None = None  # (pin, sensor type) dht_device was built for
+        self._static_data: dict[str, Any] = {}
+        self._all_data: dict[str, Any] | None = None
+        self._temp_threshold_deci: int = 0
+        self._humidity_threshold_deci: int = 0
+        self._temp_filter = _MedianFilter()
+        self._humidity_filter = _MedianFilter()
+        self.refresh_static_data()
+
+    def _setup_device(self) -> None:
+        """Validate the pin and sensor type and (re)create the sensor device, only when either changed"""
+        sensor_type: str = str(self.sensor_type).upper()
+        if sensor_type not in _SUPPORTED_SENSORS:
+            logger.error(f"Unsupported DHT sensor type: {sensor_type}. Defaulting to DHT22.")
+            sensor_type = "DHT22"
+        self.sensor_type = sensor_type
+
+        raw_dht_pin = self.dht_pin
+        try:
+            self.dht_pin = int(raw_dht_pin) if raw_dht_pin is not None else None
+        except (TypeError, ValueError):
+            logger.error(f"Invalid dht_pin value: {raw_dht_pin}. Using None.")
+            self.dht_pin = None
 
+        device_config: tuple[int | None, str] = (self.dht_pin, self.sensor_type)
+        with self._device_lock:
+            if device_config == self._device_config:
+                return
+            self._device_config = device_config
+            self._rebuild_device()
+
+    def _rebuild_device(self) -> None:
+        """Release the current sensor device and create one for the current pin and type; needs _device_lock"""
+        # DHT22 updates at most every 2s, DHT11 every 1s; faster reads only return stale data
+        self._min_read_interval = 2.0 if self.sensor_type == "DHT22" else 1.0
+        self._last_read_monotonic = None
+
+        old_device: Any = self.dht_device
+        if old_device is not None and hasattr(old_device, "exit"):
+            try:
+                old_device.exit()
+            except Exception as e:
+                logger.warning(f"Failed to release previous DHT sensor: {e}")
+
+        adafruit_dht, _ = _load_dht_backend()
         # Get the pin from board using the pin number and Dynamically create the DHT sensor based on sensor type
         pin: Any | None = None
         try:
             if self.dht_pin is None:
                 raise ValueError("dht_pin is required to initialize the DHT sensor")
-            pin = getattr(board, f"D{self.dht_pin}")
-            sensor_pin: Any = cast(Any, pin)
-            if self.sensor_type == "DHT22":
-                self.dht_device = adafruit_dht.DHT22(sensor_pin)
-            elif self.sensor_type == "DHT11":
-                self.dht_device = adafruit_dht.DHT11(sensor_pin)
-            elif self.sensor_type == "DHT21":
-                self.dht_device = adafruit_dht.DHT21(sensor_pin)
-            else:
-                # Fallback to DHT22 if sensor type is not recognized
-                logger.warning(f"Unknown sensor type {self.sensor_type}, defaulting to DHT22")
-                self.dht_device = adafruit_dht.DHT22(sensor_pin)
+            pin = _board_pins().get(self.dht_pin)
+            if pin is None:
+                raise AttributeError(f"board has no pin D{self.dht_pin}")
+            # sensor_type was validated in _setup_device, so it names the device class directly
+            self.dht_device = getattr(adafruit_dht, self.sensor_type)(cast(Any, pin))
             if hasattr(self.dht_device, "is_dummy") and self.dht_device.is_dummy():
                 return
-            logger.debug(f"DHT{self.sensor_type} sensor initialized on pin D{self.dht_pin}")
+            logger.debug(f"{self.sensor_type} sensor initialized on pin D{self.dht_pin}")
         except (AttributeError, NotImplementedError, Exception) as e:
             logger.error(f"Failed to initialize DHT sensor: {e}")
+            if isinstance(e, AttributeError):
+                logger.error(f"Available pins: {', '.join(f'D{number}' for number in sorted(_board_pins())) or 'none'}")
             logger.warning("Using DummyDHT")
             self.dht_device = adafruit_dht.DHT22(cast(Any, pin))
 
+    @property
+    def latest_temperature(self) -> float | None:
+        """Latest valid temperature reading in °C"""
+        return self._latest[0]
+
+    @latest_temperature.setter
+    def latest_temperature(self, value: float | None) -> None:
+        self._latest_temp_deci = None if value is None else _to_deci(value)
+        self._publish()
+
+    @property
+    def latest_humidity(self) -> float | None:
+        """Latest valid relative humidity reading in %"""
+        return self._latest[1]
+
+    @latest_humidity.setter
+    def latest_humidity(self, value: float | None) -> None:
+        self._latest_humidity_deci = None if value is None else _to_deci(value)
+        self._publish()
+
+    def _publish(self) -> None:
+        """Publish the current readings as a single tuple for lock-free readers"""
+        temp_deci: int | None = self._latest_temp_deci
+        humidity_deci: int | None = self._latest_humidity_deci
+        self._latest = (
+            None if temp_deci is None else temp_deci / 10.0,
+            None if humidity_deci is None else humidity_deci / 10.0,
+        )
+        self._all_data = None
+
     def get_pin(self) -> int | None:
         """Get current DHT pin"""
         return self.dht_pin
 
     def get_data(self) -> tuple[float | None, float | None]:
         """Get current temperature and humidity data"""
-        with self.dht_lock:
-            return self.latest_temperature, self.latest_humidity
+        return self._latest
 
     def register_temperature_callback(self, callback: TemperatureCallback) -> None:
         """Register a callback function to be called when temperature changes significantly"""
-        self.temperature_callbacks.append(callback)
+        self.temperature_callbacks = self.temperature_callbacks + (callback,)
 
     def register_humidity_callback(self, callback: HumidityCallback) -> None:
         """Register a callback function to be called when humidity changes significantly"""
-        self.humidity_callbacks.append(callback)
+        self.humidity_callbacks = self.humidity_callbacks + (callback,)
 
     def _notify_temperature_callbacks(self, temperature: float) -> None:
         """Notify all registered temperature callbacks"""
-        for callback in self.temperature_callbacks:
+        callbacks: tuple[TemperatureCallback, ...] = self.temperature_callbacks
+        if not callbacks:
+            return
+        for callback in callbacks:
             try:
                 callback(temperature)
             except Exception as e:
@@ -105,117 +289,163 @@ class DHTObject:
 
     def _notify_humidity_callbacks(self, humidity: float) -> None:
         """Notify all registered humidity callbacks"""
-        for callback in self.humidity_callbacks:
+        callbacks: tuple[HumidityCallback, ...] = self.humidity_callbacks
+        if not callbacks:
+            return
+        for callback in callbacks:
             try:
                 callback(humidity)
             except Exception as e:
                 logger.error(f"Error in humidity callback: {e}")
 
-    def read_dht_temperature(self) -> None:
+    def _read_sensor(self) -> tuple[float | None, float | None]:
+        """Read temperature and humidity from a single sensor transaction"""
+        with self._device_lock:
+            dht_device: Any = self.dht_device
+            try:
+                # adafruit_dht caches both values after one pulse capture
+                dht_device.measure()
+                return dht_device._temperature, dht_device._humidity  # pylint: disable=protected-access
+            except AttributeError:
+                # Fall back to the property path (e.g. DummyDHT)
+                return dht_device.temperature, dht_device.humidity
+
+    def read_dht_temperature(self, stop_event: threading.Event | None = None) -> None:
         """
         Read the temperature and humidity from the DHT sensor once
         and update the global variables.
         If the sensor returns invalid values (None or out of range), do not update globals.
+        Reads closer together than the sensor's update interval are skipped.
+        Retry backoff waits on stop_event, when given, so a shutdown ends the read early.
         """
+        now: float = monotonic()
+        if self._last_read_monotonic is not None and now - self._last_read_monotonic < self._min_read_interval:
+            return
+        debug_enabled: bool = logger.isEnabledFor(logging.DEBUG)
+        log_debug = logger.debug
 
-        # DHT sensors often fail on first attempt, so we retry
-        max_retries = 3
+        # DHT sensors often fail on first attempt, so we retry with exponential backoff.
+        # adafruit_dht only re-measures after its 2s gate, so a shorter wait would just return the same result.
+        max_retries: int = self.dht_read_retries
+        retry_delay: float = max(2.0, self._min_read_interval)
         temperature = None
         humidity = None
 
         for attempt in range(max_retries):
             try:
-                temperature = self.dht_device.temperature
-                humidity = self.dht_device.humidity
+                temperature, humidity = self._read_sensor()
 
                 # If we got valid readings, break out of retry loop
                 if temperature is not None and humidity is not None:
-                    if attempt != 0:
-                        logger.debug(f"DHT read successful on attempt {attempt + 1}")
+                    if attempt != 0 and debug_enabled:
+                        log_debug("DHT read successful on attempt %d", attempt + 1)
                     break
 
             except Exception as e:
                 error_str = str(e).lower()
                 # These are normal DHT sensor errors that should trigger a retry
-                if ("checksum did not validate" in error_str or
-                    "full buffer was not returned" in error_str or
-                    "try again" in error_str):
+                if any(token in error_str for token in _RETRY_ERRORS):
                     if attempt < max_retries - 1:
-                        logger.debug(f"DHT read attempt {attempt + 1} failed (normal), retrying...")
-                        sleep(0.1)  # Small delay before retry
+                        if debug_enabled:
+                            log_debug("DHT read attempt %d failed (normal), retrying...", attempt + 1)
+                        # Back off before retry
+                        delay: float = min(retry_delay * 2 ** attempt, _MAX_RETRY_DELAY)
+                        if stop_event is None:
+                            sleep(delay)
+                        elif stop_event.wait(delay):
+                            return
                         continue
-                    logger.debug(f"DHT sensor failed after {max_retries} attempts: {e}")
+                    if debug_enabled:
+                        log_debug("DHT sensor failed after %d attempts: %s", max_retries, e)
                     return
 
                 # For other errors, don't retry
-                logger.error(f"Error reading DHT sensor: {e}")
+                level: int = next((lvl for token, lvl in _ERROR_LEVELS if token in error_str), logging.ERROR)
+                logger.log(level, f"Error reading DHT sensor: {e}")
                 return
 
         # Process the readings if we got them
         if temperature is None and humidity is None:
-            logger.debug("No valid DHT readings obtained after retries")
+            log_debug("No valid DHT readings obtained after retries")
+            return
+
+        self._last_read_monotonic = now
+        if debug_enabled:
+            log_debug("Raw DHT read: temperature=%s, humidity=%s", temperature, humidity)
+
+        # Only update if values are valid
+        temp_valid: bool = temperature is not None and self.min_dht_temp < temperature < self.max_dht_temp
+        humidity_valid: bool = humidity is not None and self.min_humidity <= humidity <= self.max_humidity
+        # Valid readings go through the median filter, so a single spike never reaches the callbacks
+        temp_deci: int = self._temp_filter.push(_to_deci(cast(float, temperature))) if temp_valid else 0
+        humidity_deci: int = self._humidity_filter.push(_to_deci(cast(float, humidity))) if humidity_valid else 0
+
+        # Steady state: neither reading moved, so skip change detection and publishing
+        if temp_valid and humidity_valid and not (
+                (temp_deci != self._latest_temp_deci) | (humidity_deci != self._latest_humidity_deci)):
+            if debug_enabled:
+                log_debug("Temperature: %s°C, Humidity: %s%% (unchanged)", temp_deci / 10.0, humidity_deci / 10.0)
             return
 
-        logger.debug(f"Raw DHT read: temperature={temperature}, humidity={humidity}")
-
-        with self.dht_lock:
-            # Only update if values are valid
-            if temperature is not None and self.min_dht_temp < temperature < self.max_dht_temp:
-                rounded_temp: float = round(float(temperature), 1)
-                logged_info = False
-                if self.latest_temperature != rounded_temp:
-                    self.latest_temperature = rounded_temp
-                    # Only log when temperature changes significantly or this is the first reading
-                    if (self.last_logged_dht_temp is None or
-                        abs(rounded_temp - self.last_logged_dht_temp) >= self.dht_temp_change_threshold):
-                        logger.info(f"Updated temperature: {self.latest_temperature}°C")
-                        self.last_logged_dht_temp = rounded_temp
-                        # Notify callbacks about temperature change
-                        self._notify_temperature_callbacks(rounded_temp)
-                        logged_info = True
-
-                # Always log current temperature for debugging (unless we just logged at info level)
-                if not logged_info:
-                    logger.debug(f"Temperature: {rounded_temp}°C")
-            else:
-                logger.error("Temperature value not updated (None or out of range)")
-
-            if humidity is not None and self.min_humidity <= humidity <= self.max_humidity:
-                rounded_humidity: float = round(float(humidity), 1)
-                logged_info = False
-                if self.latest_humidity != rounded_humidity:
-                    self.latest_humidity = rounded_humidity
-                    # Only log when humidity changes significantly or this is the first reading
-                    if (self.last_logged_dht_humidity is None or
-                        abs(rounded_humidity - self.last_logged_dht_humidity) >= self.dht_humidity_change_threshold):
-                        logger.info(f"Updated humidity: {self.latest_humidity}%")
-                        self.last_logged_dht_humidity = rounded_humidity
-                        # Notify callbacks about humidity change
-                        self._notify_humidity_callbacks(rounded_humidity)
-                        logged_info = True
-
-                # Always log current humidity for debugging (unless we just logged at info level)
-                if not logged_info:
-                    logger.debug(f"Humidity: {rounded_humidity}%")
-            else:
-                logger.error("Humidity value not updated (None or out of range)")
+        notify_temp: bool = False
+        if temp_valid:
+            notify_temp = _significant_change(
+                temp_deci, self._latest_temp_deci, self._last_logged_temp_deci, self._temp_threshold_deci)
+            if notify_temp:
+                self._last_logged_temp_deci = temp_deci
+            self._latest_temp_deci = temp_deci
+
+        notify_humidity: bool = False
+        if humidity_valid:
+            notify_humidity = _significant_change(
+                humidity_deci, self._latest_humidity_deci, self._last_logged_humidity_deci,
+                self._humidity_threshold_deci)
+            if notify_humidity:
+                self._last_logged_humidity_deci = humidity_deci
+            self._latest_humidity_deci = humidity_deci
+
+        # A single atomic rebind; readers always see a consistent (temperature, humidity) pair
+        self._publish()
+        latest_temperature, latest_humidity = self._latest
+
+        _report_reading("temperature", "°C", latest_temperature, temp_valid, notify_temp,
+                        self._notify_temperature_callbacks, debug_enabled)
+        _report_reading("humidity", "%", latest_humidity, humidity_valid, notify_humidity,
+                        self._notify_humidity_callbacks, debug_enabled)
+
+    def refresh_static_data(self) -> None:
+        """Rebuild the data derived from the DHT settings after they change"""
+        self._setup_device()
+        self.dht_read_retries = min(max(1, int(self.dht_read_retries)), _MAX_READ_RETRIES)
+        self._temp_threshold_deci = _to_deci(self.dht_temp_change_threshold)
+        self._humidity_threshold_deci = _to_deci(self.dht_humidity_change_threshold)
+        self._static_data = {
+            "sensor_type": self.sensor_type,
+            "dht_pin": self.dht_pin,
+            "MIN_DHT_TEMP": self.min_dht_temp,
+            "MAX_DHT_TEMP": self.max_dht_temp,
+            "MIN_HUMIDITY": self.min_humidity,
+            "MAX_HUMIDITY": self.max_humidity,
+            "DHT_TEMP_CHANGE_THRESHOLD": self.dht_temp_change_threshold,
+            "DHT_HUMIDITY_CHANGE_THRESHOLD": self.dht_humidity_change_threshold,
+            "DHT_READ_RETRIES": self.dht_read_retries
+        }
+        self._all_data = None
 
     def get_all_data(self) -> dict[str, Any]:
-        """Get all DHT data as a dictionary"""
-        with self.dht_lock:
-            return {
-                "sensor_type": self.sensor_type,
-                "dht_pin": self.dht_pin,
-                "latest_temperature": self.latest_temperature,
-                "latest_humidity": self.latest_humidity,
-                "MIN_DHT_TEMP": self.min_dht_temp,
-                "MAX_DHT_TEMP": self.max_dht_temp,
-                "MIN_HUMIDITY": self.min_humidity,
-                "MAX_HUMIDITY": self.max_humidity,
-                "DHT_TEMP_CHANGE_THRESHOLD": self.dht_temp_change_threshold,
-                "DHT_HUMIDITY_CHANGE_THRESHOLD": self.dht_humidity_change_threshold
-            }
+        """
+        Get all DHT data as a dictionary.
+        The dict is cached until the readings or settings change, so callers must not mutate it.
+        """
+        all_data: dict[str, Any] | None = self._all_data
+        if all_data is None:
+            temperature, humidity = self._latest
+            all_data = self._static_data.copy()
+            all_data["latest_temperature"] = temperature
+            all_data["latest_humidity"] = humidity
+            self._all_data = all_data
+        return all_data
 
     def save(self) -> dict[str, Any]:
         """Save current DHT state to a dictionary"""
-        return self.get_all_data()
+        return dict(self.get_all_data())
@@ -4,6 +4,7 @@ FanObject: Handles GPIO PWM output for a fan service.
 from typing import Any
 import threading
 import logging
+from time import monotonic
 import logManager
 
 try:
@@ -15,10 +16,74 @@ from services.utils import get_pi_temp
 
 logger: logging.Logger = logManager.logger.get_logger(__name__)
 
+# How many service intervals the fan loop may wait between runs while the temperature is stable
+_FAN_BACKOFF: int = 4
+
+# One pigpiod connection shared by all fans, reference counted so the last cleanup closes it
+_pi_lock = threading.Lock()
+_shared_pi: dict[str, Any] = {
+    "pi": None,
+    "users": 0,
+}
+
+def _acquire_pi() -> Any:
+    """Return the shared pigpio connection, connecting on first use"""
+    with _pi_lock:
+        if _shared_pi["pi"] is None or not _shared_pi["pi"].connected:
+            # Fans still holding the old handle release it as stale, so the count starts over
+            _shared_pi["pi"] = pigpio.pi()
+            _shared_pi["users"] = 0
+        _shared_pi["users"] += 1
+        return _shared_pi["pi"]
+
+def _release_pi(pi: Any) -> None:
+    """
+    Release one user of the shared pigpio connection, stopping it after the last one.
+    A handle that was replaced by a reconnect is not counted any more, so releasing it is a no-op.
+    """
+    with _pi_lock:
+        if pi is not _shared_pi["pi"]:
+            return
+        _shared_pi["users"] -= 1
+        if _shared_pi["users"] <= 0 and _shared_pi["pi"] is not None:
+            _shared_pi["pi"].stop()
+            _shared_pi["pi"] = None
+            _shared_pi["users"] = 0
+
 class FanObject:
     """
     Class representing a fan object with PWM control based on temperature.
     """
+    __slots__ = (
+        "id",
+        "name",
+        "gpio_pin",
+        "pwm_frequency",
+        "min_temperature",
+        "max_temperature",
+        "min_speed",
+        "max_speed",
+        "cleanup_done",
+        "last_logged_temp",
+        "temp_change_threshold",
+        "is_full_speed_mode",
+        "_full_speed_deadline",
+        "_full_speed_event",
+        "_full_speed_lock",
+        "_full_speed_thread",
+        "full_speed_time_duration",
+        "_scale",
+        "_offset",
+        "_last_duty",
+        "_last_temp",
+        "_hysteresis",
+        "_last_sample",
+        "_gradient",
+        "_all_data",
+        "pi",
+        "_shares_pi",
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
         self.id: str = str(data.get("id") or "")
         self.name: str = str(data.get("name") or "Fan")
@@ -31,33 +96,59 @@ class FanObject:
         self.cleanup_done: bool = False
         self.last_logged_temp: float | None = None
         self.temp_change_threshold: float = data.get("temp_change_threshold", 0.5)  # Log threshold
-        self.full_speed_timer: threading.Timer | None = None
         self.is_full_speed_mode: bool = False
+        # Full speed mode is ended by one long-lived worker per fan instead of a Timer thread per request
+        self._full_speed_deadline: float = 0.0
+        self._full_speed_event = threading.Event()
+        self._full_speed_lock = threading.Lock()
+        self._full_speed_thread: threading.Thread | None = None
         self.full_speed_time_duration: int = data.get("full_speed_time_duration", 5)  # Full speed mode in seconds
-        self.pi = pigpio.pi()
-        if not self.pi.connected:
+        self._scale: float = 0.0
+        self._offset: float = 0.0
+        self._last_duty: int = -1  # Last duty cycle written to pigpio, -1 when unknown
+        self._last_temp: float | None = None  # Temperature behind the last duty cycle write
+        self._hysteresis: float = 0.0
+        self._last_sample: tuple[float, float] | None = None  # (monotonic time, temperature) of the last run
+        self._gradient: float | None = None  # Temperature change in °C per second between the last two runs
+        self._all_data: dict[str, Any] | None = None
+        self.refresh_static_data()
+        self.pi = _acquire_pi()
+        self._shares_pi: bool = self.pi.connected
+        if not self._shares_pi:
+            _release_pi(self.pi)
             logger.warning("Could not connect to pigpio daemon, fan control disabled (using dummy)")
             self.pi = DummyPigpioInstance()
             return
         # Set PWM frequency and start with 0% duty cycle
         self.pi.set_PWM_frequency(self.gpio_pin, self.pwm_frequency)
         self.pi.set_PWM_dutycycle(self.gpio_pin, 0)
+        self._last_duty = 0
 
-    def renormalize(self, n: float, range1: tuple[float, float], range2: tuple[float, float]) -> float:
-        """Scale n from range1 to range2."""
-        delta1: float = range1[1] - range1[0]
-        delta2: float = range2[1] - range2[0]
-        return (delta2 * (n - range1[0]) / delta1) + range2[0]
+    def refresh_static_data(self) -> None:
+        """Rebuild the data derived from the fan settings after they change"""
+        # Temperature to duty cycle is affine, so precompute it as speed = temp * scale + offset
+        delta_temp: float = self.max_temperature - self.min_temperature
+        self._scale = (self.max_speed - self.min_speed) / delta_temp if delta_temp else 0.0
+        self._offset = self.min_speed - self.min_temperature * self._scale
+        # Temperature moves smaller than this around the last write are treated as sensor noise
+        self._hysteresis = self.temp_change_threshold / 2
+        # The pin may have changed, so force the next run() to write the duty cycle
+        self._last_duty = -1
+        self._last_temp = None
+        self._all_data = None
 
     def cleanup(self) -> None:
         """Cleanup the fan object, stopping PWM and releasing resources."""
         if not self.cleanup_done and self.pi.connected:
-            # Cancel any pending timer
-            if self.full_speed_timer:
-                self.full_speed_timer.cancel()
             self.pi.set_PWM_dutycycle(self.gpio_pin, 0)
-            self.pi.stop()
+            self._last_duty = 0
+            if self._shares_pi:
+                _release_pi(self.pi)
+            else:
+                self.pi.stop()
             self.cleanup_done = True
+            # Let the full speed worker exit
+            self._full_speed_event.set()
 
     def run(self) -> None:
         """Run the fan control logic based on the current temperature."""
@@ -66,45 +157,91 @@ class FanObject:
             return
 
         temp: float = max(self.min_temperature, min(self.max_temperature, get_pi_temp()))
+        now: float = monotonic()
+        last_sample: tuple[float, float] | None = self._last_sample
+        if last_sample is not None and now > last_sample[0]:
+            self._gradient = (temp - last_sample[1]) / (now - last_sample[0])
+        self._last_sample = (now, temp)
+        last_temp: float | None = self._last_temp
+        if last_temp is not None and abs(temp - last_temp) < self._hysteresis:
+            return
         # Convert temp to pigpio duty cycle (0-255)
-        range_temp: tuple[float, float] = (self.min_temperature, self.max_temperature)
-        range_speed: tuple[float, float] = (self.min_speed, self.max_speed)
-        duty_cycle: int = int(round(self.renormalize(temp, range_temp, range_speed)))
-        self.pi.set_PWM_dutycycle(self.gpio_pin, duty_cycle)
+        duty_cycle: int = int(round(temp * self._scale + self._offset))
+        # Each write is a round-trip to pigpiod, so skip it when the duty cycle is unchanged
+        if duty_cycle != self._last_duty:
+            self.pi.set_PWM_dutycycle(self.gpio_pin, duty_cycle)
+            self._last_duty = duty_cycle
+            self._last_temp = temp
 
         # Only log when temperature changes significantly or this is the first reading
         if self.last_logged_temp is None or abs(temp - self.last_logged_temp) >= self.temp_change_threshold:
-            logger.info(f"Fan: Temperature {temp}°C, Duty Cycle {duty_cycle}")
+            logger.info("Fan: Temperature %s°C, Duty Cycle %d", temp, duty_cycle)
             self.last_logged_temp = temp
         else:
-            logger.debug(f"Fan: Temperature {temp}°C, Duty Cycle {duty_cycle} (no significant change)")
+            logger.debug("Fan: Temperature %s°C, Duty Cycle %d (no significant change)", temp, duty_cycle)
+
+    def next_interval(self, interval: float) -> float:
+        """
+        Return how long the service loop may wait before the next run().
+        While the temperature trend would stay inside the hysteresis band for a longer wait,
+        the wait is stretched to interval * _FAN_BACKOFF.
+        """
+        gradient: float | None = self._gradient
+        if gradient is None or self.is_full_speed_mode:
+            return interval
+        backoff: float = interval * _FAN_BACKOFF
+        return backoff if abs(gradient) * backoff < self._hysteresis else interval
 
     def set_full(self) -> None:
         """Set the fan to full speed for a specified duration, then return to normal operation."""
-        # Cancel any existing timer
-        if self.full_speed_timer:
-            self.full_speed_timer.cancel()
-
-        # Set full speed mode
-        self.is_full_speed_mode = True
-        self.pi.set_PWM_dutycycle(self.gpio_pin, self.max_speed)
+        with self._full_speed_lock:
+            # A repeated request just pushes the deadline out
+            self._full_speed_deadline = monotonic() + max(self.full_speed_time_duration, 1)
+            self.is_full_speed_mode = True
+            self.pi.set_PWM_dutycycle(self.gpio_pin, self.max_speed)
+            self._last_duty = self.max_speed
+            self._last_temp = None
+            if self._full_speed_thread is None:
+                self._full_speed_thread = threading.Thread(target=self._full_speed_worker, daemon=True)
+                self._full_speed_thread.start()
         logger.info(f"Fan set to full speed for {self.full_speed_time_duration} seconds")
+        self._full_speed_event.set()
 
-        # Set timer to return to normal after the specified duration
-        self.full_speed_timer = threading.Timer(max(self.full_speed_time_duration, 1), self._return_to_normal)
-        self.full_speed_timer.start()
+    def _full_speed_worker(self) -> None:
+        """Wait for full speed requests and return to normal once their deadline has passed."""
+        event: threading.Event = self._full_speed_event
+        while not self.cleanup_done:
+            event.wait()
+            event.clear()
+            # set_full() may move the deadline while we wait, so re-check it after every wake
+            remaining: float = self._full_speed_deadline - monotonic()
+            while remaining > 0 and not self.cleanup_done:
+                event.wait(remaining)
+                event.clear()
+                remaining = self._full_speed_deadline - monotonic()
+            with self._full_speed_lock:
+                if self.cleanup_done or not self.is_full_speed_mode or self._full_speed_deadline > monotonic():
+                    continue
+                self.is_full_speed_mode = False
+            self._return_to_normal()
 
     def _return_to_normal(self) -> None:
         """Return fan to normal temperature-based operation."""
-        self.is_full_speed_mode = False
-        self.full_speed_timer = None
         logger.info("Fan returning to normal temperature-based operation")
         # Immediately run normal operation to set appropriate speed
-        self.run()
+        try:
+            self.run()
+        except Exception as e:
+            logger.error(f"Error returning fan to normal operation: {e}")
 
     def get_all_data(self) -> dict[str, Any]:
-        """Get all fan service data"""
-        return {
+        """
+        Get all fan service data.
+        The dict is cached until refresh_static_data(), so callers must not mutate it.
+        """
+        if self._all_data is not None:
+            return self._all_data
+        self._all_data = {
             "id": self.id,
             "name": self.name,
             "gpio_pin": self.gpio_pin,
@@ -116,9 +253,10 @@ class FanObject:
             "temp_change_threshold": self.temp_change_threshold,
             "full_speed_time_duration": self.full_speed_time_duration,
         }
+        return self._all_data
 
     def save(self) -> dict[str, Any]:
         """Save the fan service configuration"""
-        data = self.get_all_data()
+        data = dict(self.get_all_data())
         data.pop("id", None)  # id is stored as the yaml key, not in the value
         return data
@@ -1,9 +1,9 @@
 """
 KlokObject: Handles TM1637 display for a clock service.
 """
+from functools import lru_cache
 import logging
 from typing import Any
-from datetime import datetime
 import time
 
 import logManager
@@ -12,16 +12,36 @@ from services.tm1637 import TM1637
 
 logger: logging.Logger = logManager.logger.get_logger(__name__)
 
+@lru_cache(maxsize=2)
+def _digits_for_minute(epoch_minute: int) -> tuple[int, int, int, int]:
+    """Return the four local-time display digits (HH:MM) for a minute since the epoch"""
+    local_time: time.struct_time = time.localtime(epoch_minute * 60)
+    hour, minute = local_time.tm_hour, local_time.tm_min
+    return (hour // 10, hour % 10, minute // 10, minute % 10)
+
 class KlokObject:
     """
     Class representing a klok object with TM1637 display functionality.
     """
+    __slots__ = (
+        "clk_pin",
+        "dio_pin",
+        "brightness",
+        "last_brightness",
+        "last_time",
+        "last_double_point",
+        "double_point",
+        "power_state",
+        "last_double_point_toggle",
+        "display",
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
         self.clk_pin: int = data.get("CLK_pin", 24)
         self.dio_pin: int = data.get("DIO_pin", 23)  # GPIO pin for the fan
         self.brightness: float = data.get("brightness", 0.0)  # Default brightness
         self.last_brightness: float | None = None  # Track last brightness to avoid unnecessary updates
-        self.last_time: list[int] | None = None
+        self.last_time: tuple[int, int, int, int] | None = None
         self.last_double_point: bool | None = None
         self.double_point: bool = True  # Initialize doublepoint state
         self.power_state: bool = True
@@ -43,31 +63,30 @@ class KlokObject:
                 self.last_double_point = None
             return
 
-        now: datetime = datetime.now()
-        hour, minute = now.hour, now.minute
-        current_time = [hour // 10, hour % 10, minute // 10, minute % 10]
-
-        # Update time display only if changed
-        if self.last_time != current_time:
-            self.display.show(current_time)
-            self.last_time = current_time
-
-        # Update brightness only if changed
-        if self.last_brightness != self.brightness:
-            self.display.set_brightness(self.brightness)
-            self.last_brightness = self.brightness
+        now: float = time.time()
+        # Only minutes are shown, so the digits are memoized per epoch minute
+        current_time: tuple[int, int, int, int] = _digits_for_minute(int(now // 60))
 
         # Toggle doublepoint every 0.5 seconds based on time, not call frequency
-        current_time_seconds: float = time.time()
-        if current_time_seconds - self.last_double_point_toggle >= 0.5:
+        if now - self.last_double_point_toggle >= 0.5:
             self.double_point = not self.double_point
-            self.last_double_point_toggle = current_time_seconds
+            self.last_double_point_toggle = now
 
-        # Update doublepoint only if changed
-        if self.last_double_point != self.double_point:
-            self.display.show_double_point(self.double_point)
+        # Digits, doublepoint and brightness share one frame, so send a single frame only if any changed
+        if (self.last_time != current_time or self.last_brightness != self.brightness
+                or self.last_double_point != self.double_point):
+            self.display.show_all(current_time, self.brightness, self.double_point)
+            self.last_time = current_time
+            self.last_brightness = self.brightness
             self.last_double_point = self.double_point
 
+    def seconds_until_next_update(self) -> float:
+        """Return how long the service loop can sleep before show() has something new to draw."""
+        if not self.power_state:
+            return 0.5
+        # The doublepoint toggle is the most frequent change; minute rollovers land on a toggle too
+        return max(0.01, self.last_double_point_toggle + 0.5 - time.time())
+
     def toggle_power(self) -> None:
         """Toggle the power state"""
         self.power_state = not self.power_state
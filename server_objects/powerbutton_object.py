@@ -28,6 +28,7 @@ GPIO_BCM: Any = cast(Any, IO.BCM)
 GPIO_IN: Any = cast(Any, IO.IN)
 GPIO_LOW: Any = cast(Any, IO.LOW)
 GPIO_PUD_UP: Any = cast(Any, IO.PUD_UP)
+GPIO_FALLING: Any = cast(Any, IO.FALLING)
 
 # WS2811 strip constants
 _LED_COUNT: int = 1
@@ -40,6 +41,27 @@ class PowerButtonObject:
     """
     Power button service for handling GPIO button input and WS2811 LED output.
     """
+    __slots__ = (
+        "button_pin",
+        "long_press_duration",
+        "debounce_time",
+        "led_pin",
+        "led_brightness",
+        "led_dma",
+        "host_shutdown_url",
+        "host_api_key",
+        "shutdown_event",
+        "_gpio_input",
+        "_gpio_low",
+        "last_press_time",
+        "_press_event",
+        "_edge_detect",
+        "_strip",
+        "_last_color",
+        "_led_stop_event",
+        "_led_thread",
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
         self.button_pin: int = data.get("button_pin", 3)
         self.long_press_duration: float = data.get("long_press_duration", 3.0)
@@ -62,7 +84,23 @@ class PowerButtonObject:
         # GPIO button setup
         IO.setmode(GPIO_BCM)
         IO.setup(self.button_pin, GPIO_IN, pull_up_down=GPIO_PUD_UP)
+        # Bound once, button_pressed() runs at up to 100 Hz while the button is held
+        self._gpio_input: Any = IO.input
+        self._gpio_low: Any = GPIO_LOW
         self.last_press_time: float = time.time()
+        # Presses are latched by a kernel edge interrupt, so the idle service loop never reads the pin
+        self._press_event: Event = Event()
+        self._edge_detect: bool = False
+        try:
+            IO.add_event_detect(
+                self.button_pin,
+                GPIO_FALLING,
+                callback=self._on_button_edge,
+                bouncetime=max(1, int(self.debounce_time * 1000)),
+            )
+            self._edge_detect = True
+        except (AttributeError, RuntimeError) as e:
+            logger.warning(f"Button edge detection unavailable ({e}), polling the button instead")
 
         # WS2811 LED setup
         self._strip: Any = PixelStrip(
@@ -89,6 +127,7 @@ class PowerButtonObject:
             )
             self._strip.begin()
 
+        self._last_color: int | None = None  # Last colour pushed to the strip
         self._led_stop_event: threading.Event = threading.Event()
         self._led_thread: threading.Thread | None = None
 
@@ -103,8 +142,13 @@ class PowerButtonObject:
 
     def _raw_set_color(self, r: int, g: int, b: int) -> None:
         """Set pixel color directly without touching the background thread."""
-        self._strip.setPixelColor(0, Color(r, g, b))
+        color: int = Color(r, g, b)
+        # Each show() clocks a full frame out to the strip, so skip it when nothing changed
+        if color == self._last_color:
+            return
+        self._strip.setPixelColor(0, color)
         self._strip.show()
+        self._last_color = color
 
     def _stop_led_effect(self) -> None:
         """Signal the background LED thread to stop and wait for it."""
@@ -204,12 +248,39 @@ class PowerButtonObject:
     def cleanup(self) -> None:
         """Clean up LED and GPIO resources."""
         self._led_off()
-        IO.cleanup()
+        if self._edge_detect:
+            # A leftover callback makes the next add_event_detect on this pin fail with conflicting edge detection
+            try:
+                IO.remove_event_detect(self.button_pin)
+            except (AttributeError, RuntimeError) as e:
+                logger.warning(f"Failed to remove button edge detection: {e}")
+            self._edge_detect = False
+        self.wake()
+        # Only release the button pin; the klok display may still be driving its own pins
+        IO.cleanup(self.button_pin)
         logger.info("IO cleanup completed")
 
+    def _on_button_edge(self, _channel: int) -> None:
+        """GPIO interrupt callback: latch a press for the service loop to handle."""
+        self._press_event.set()
+
+    def wait_for_press(self, timeout: float) -> bool:
+        """
+        Block until the edge interrupt latches a press, wake() is called or timeout passes.
+        Returns False without waiting when edge detection is unavailable and the caller has to poll.
+        """
+        if not self._edge_detect:
+            return False
+        self._press_event.wait(timeout)
+        return True
+
+    def wake(self) -> None:
+        """Release a pending wait_for_press(), e.g. on shutdown; run() then just finds the button released."""
+        self._press_event.set()
+
     def button_pressed(self) -> bool:
         """Return True if the button is currently pressed (LOW with pull-up)."""
-        return IO.input(self.button_pin) == GPIO_LOW
+        return self._gpio_input(self.button_pin) == self._gpio_low
 
     def wait_for_button_release(self) -> None:
         """Block until the button is released."""
@@ -220,7 +291,7 @@ class PowerButtonObject:
         """Execute a clean system shutdown."""
         logger.info("Initiating system shutdown...")
         try:
-            subprocess.run(['sync'], check=True)
+            os.sync()  # Flush filesystems directly instead of spawning /bin/sync
             if os.geteuid() == 0:
                 # Attempt to call configured host shutdown service (useful when running in Docker).
                 if self.host_api_key:
@@ -260,7 +331,11 @@ class PowerButtonObject:
     def run(self) -> None:
         """Poll the button once; called repeatedly by the service loop."""
         try:
-            if not self.button_pressed():
+            if self._edge_detect:
+                if not self._press_event.is_set():
+                    return
+                self._press_event.clear()
+            elif not self.button_pressed():
                 return
 
             # Debounce
@@ -270,28 +345,32 @@ class PowerButtonObject:
 
             logger.info("Button pressed")
             self._stop_led_effect()
-            press_start: float = time.time()
+            # Integer nanoseconds on the monotonic clock, so an NTP step mid-press cannot skew the duration
+            press_start: int = time.monotonic_ns()
+            long_press_ns: int = int(self.long_press_duration * 1e9)
+            phase_2_ns: int = long_press_ns // 2
+            phase_3_ns: int = long_press_ns * 3 // 4
 
             while self.button_pressed() and not self.shutdown_event.is_set():
-                press_duration: float = time.time() - press_start
-                progress: float = press_duration / self.long_press_duration
+                now_ns: int = time.monotonic_ns()
+                press_ns: int = now_ns - press_start
 
-                if press_duration >= self.long_press_duration:
-                    logger.info(f"Long press detected ({press_duration:.1f}s) – shutting down")
+                if press_ns >= long_press_ns:
+                    logger.info("Long press detected (%.1fs) – shutting down", press_ns / 1e9)
                     self._led_shutdown_effect()
                     self.execute_shutdown()
                     return
 
                 # Colour feedback based on how long the button has been held
-                if progress < 0.50:
+                if press_ns < phase_2_ns:
                     # Phase 1 – solid blue
                     self._raw_set_color(0, 80, 255)
-                elif progress < 0.75:
+                elif press_ns < phase_3_ns:
                     # Phase 2 – warm orange warning
                     self._raw_set_color(255, 80, 0)
                 else:
                     # Phase 3 – urgent fast red blink
-                    if int(time.time() * 12) % 2 == 0:
+                    if now_ns * 12 // 1_000_000_000 % 2 == 0:
                         self._raw_set_color(255, 0, 0)
                     else:
                         self._raw_set_color(0, 0, 0)
@@ -299,9 +378,9 @@ class PowerButtonObject:
                 time.sleep(0.05)
 
             # Button released before long-press threshold
-            press_duration = time.time() - press_start
-            if press_duration < self.long_press_duration:
-                logger.info(f"Short press ({press_duration:.1f}s) – button event logged")
+            press_ns = time.monotonic_ns() - press_start
+            if press_ns < long_press_ns:
+                logger.info("Short press (%.1fs) – button event logged", press_ns / 1e9)
                 self._led_flash(255, 255, 255, times=2, on_time=0.08, off_time=0.05)
                 self._led_start_breathing(0, 200, 60)  # resume green idle
 
@@ -2,9 +2,12 @@
 Thermostat service for managing thermostat operations
 """
 import asyncio
-from time import localtime, strftime
-from typing import Any, TypedDict, cast
+from contextlib import asynccontextmanager
+import json
+from time import localtime, monotonic, strftime, time
+from typing import Any, AsyncIterator, TypedDict, cast
 import logging
+import threading
 
 from bleak.exc import BleakError
 
@@ -13,6 +16,86 @@ import logManager
 
 logger: logging.Logger = logManager.logger.get_logger(__name__)
 
+# Upper bounds for BLE operations, so an unreachable device fails fast instead of waiting out bleak's defaults
+CONNECT_TIMEOUT: float = 5.0
+REQUEST_TIMEOUT: float = 10.0
+
+# Backoff for scheduled polls of an unreachable thermostat, doubled per consecutive failure
+_POLL_BACKOFF_MIN: float = 5.0
+_POLL_BACKOFF_MAX: float = 300.0
+
+# Stretch between scheduled polls while a thermostat's state stays unchanged, grown 1.5x per idle poll
+_POLL_IDLE_MIN: float = 30.0
+_POLL_IDLE_MAX: float = 600.0
+
+# Routes and the poller run on different event loops and threads, so the BLE locks are threading locks.
+# One lock per thermostat MAC is held for a whole connect..disconnect session, so a route never
+# connects or disconnects underneath a running poll of the same device.
+_device_locks: dict[str, threading.Lock] = {}
+_device_locks_guard = threading.Lock()
+# BlueZ handles one LE connection attempt at a time; held only around connect(), never a whole session
+_adapter_lock = threading.Lock()
+# Longest wait for a BLE lock, so a stuck session fails its waiters instead of blocking them forever
+_LOCK_TIMEOUT: float = 30.0
+
+def _device_lock(mac: str) -> threading.Lock:
+    """Return the process-wide session lock for a thermostat MAC"""
+    key: str = mac.upper()
+    with _device_locks_guard:
+        lock: threading.Lock | None = _device_locks.get(key)
+        if lock is None:
+            lock = _device_locks[key] = threading.Lock()
+        return lock
+
+async def _acquire(lock: threading.Lock, timeout: float) -> bool:
+    """
+    Acquire a threading lock in a worker thread, so the event loop keeps running while it waits.
+    A waiter cancelled while the worker still blocks hands the lock straight back once it is taken.
+    """
+    guard = threading.Lock()
+    state: dict[str, bool] = {"acquired": False, "abandoned": False}
+
+    def wait() -> bool:
+        if not lock.acquire(timeout=timeout):
+            return False
+        with guard:
+            if state["abandoned"]:
+                lock.release()
+                return False
+            state["acquired"] = True
+        return True
+
+    try:
+        return await asyncio.to_thread(wait)
+    except asyncio.CancelledError:
+        with guard:
+            state["abandoned"] = True
+            if state["acquired"]:
+                lock.release()
+        raise
+
+@asynccontextmanager
+async def _hold(lock: threading.Lock, name: str) -> AsyncIterator[None]:
+    """Hold a threading lock from async code, waiting at most _LOCK_TIMEOUT for it"""
+    if not await _acquire(lock, _LOCK_TIMEOUT):
+        raise asyncio.TimeoutError(f"{name} still busy after {_LOCK_TIMEOUT}s")
+    try:
+        yield
+    finally:
+        lock.release()
+
+# Last formatted timestamp as (epoch second, text); rebound as one tuple so threads never see a mix
+_timestamp_cache: dict[str, tuple[int, str]] = {"last": (-1, "")}
+
+def _now_str() -> str:
+    """Return the local time as "%Y-%m-%d %H:%M:%S", formatting at most once per second"""
+    second: int = int(time())
+    cached_second, text = _timestamp_cache["last"]
+    if cached_second != second:
+        text = strftime("%Y-%m-%d %H:%M:%S", localtime(second))
+        _timestamp_cache["last"] = (second, text)
+    return text
+
 
 class HeatingCoolingState(TypedDict):
     """Represents the heating/cooling state of the thermostat"""
@@ -20,9 +103,39 @@ class HeatingCoolingState(TypedDict):
     str: str
 
 
+# Shared, read-only states returned by calculate_heating_cooling_state; callers must not mutate them
+_STATE_OFF: HeatingCoolingState = {"int": 0, "str": "Off"}
+_STATE_HEATING: HeatingCoolingState = {"int": 1, "str": "Heating"}
+_STATE_MANUAL: HeatingCoolingState = {"int": 1, "str": "Manual"}
+_STATE_AUTO: HeatingCoolingState = {"int": 3, "str": "Auto"}
+
+
 class ThermostatObject:
     """Service for managing thermostat operations"""
 
+    __slots__ = (
+        "id",
+        "mac",
+        "failed_connection",
+        "target_heating_cooling_state",
+        "target_temperature",
+        "current_heating_cooling_state",
+        "current_temperature",
+        "current_relative_humidity",
+        "last_updated",
+        "first_seen",
+        "equiva_thermostat",
+        "min_temperature",
+        "max_temperature",
+        "dht_connected",
+        "_poll_backoff",
+        "_poll_backoff_until",
+        "_last_poll_monotonic",
+        "_poll_idle",
+        "_poll_idle_until",
+        "_status_json",
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
         self.id: str = str(data.get("id") or "")  # Unique identifier for the thermostat
         self.mac: str = str(data.get("mac") or "")  # MAC address of the thermostat
@@ -33,11 +146,17 @@ class ThermostatObject:
         self.current_temperature: float = data.get("currentTemperature", 0.0)  # Default DHT temperature
         self.current_relative_humidity: float = data.get("currentRelativeHumidity", 0.0)  # Default DHT humidity
         self.last_updated: str | None = data.get("last_updated")  # Last update timestamp
-        self.first_seen: str = data.get("first_seen", strftime("%Y-%m-%d %H:%M:%S", localtime()))
+        self.first_seen: str = data["first_seen"] if "first_seen" in data else _now_str()
         self.equiva_thermostat: Thermostat = Thermostat(self.mac)
         self.min_temperature = data.get("min_temperature", 5.0)  # Minimum temperature setting
         self.max_temperature = data.get("max_temperature", 30.0)  # Maximum
         self.dht_connected: bool = False  # DHT connection status
+        self._poll_backoff: float = 0.0  # Current scheduled-poll backoff in seconds, 0 while healthy
+        self._poll_backoff_until: float = 0.0  # Monotonic time before which scheduled polls are skipped
+        self._last_poll_monotonic: float | None = None  # Monotonic time of the last successful poll
+        self._poll_idle: float = 0.0  # Current idle stretch in seconds, 0 while the state is changing
+        self._poll_idle_until: float = 0.0  # Monotonic time before which idle scheduled polls are skipped
+        self._status_json: tuple[tuple[Any, ...], str] | None = None  # (status values, encoded status body)
 
     def calculate_heating_cooling_state(self, mode: list[str], valve: int | None = None) -> HeatingCoolingState:
         """
@@ -48,20 +167,15 @@ class ThermostatObject:
         2 - Cooling (not used in this context)
         3 - Auto
         """
-        # Determine the state based on mode and valve
+        # With a valve position this is the current state: heating while the valve is open and not off
         if valve is not None:
-            if 'OFF' in mode or (valve is not None and valve <= 0):
-                return {"int": 0, "str": "Off"}  # Off
-            if valve and valve > 0:
-                return {"int": 1, "str": "Heating"}  # Heating
-            return {"int": 0, "str": "Off"}  # Off
-        if valve is None:
-            if 'AUTO' in mode:
-                return {"int": 3, "str": "Auto"}  # Auto mode
-            if 'MANUAL' in mode:
-                return {"int": 1, "str": "Manual"}  # Manual mode
-            return {"int": 0, "str": "Off"}  # Off
-        return {"int": 0, "str": "Off"}  # Default
+            return _STATE_HEATING if valve > 0 and 'OFF' not in mode else _STATE_OFF
+        # Without one it is the target state, taken from the mode flags
+        if 'AUTO' in mode:
+            return _STATE_AUTO  # Auto mode
+        if 'MANUAL' in mode:
+            return _STATE_MANUAL  # Manual mode
+        return _STATE_OFF  # Off
 
     def update_dht_related_status(self, **kwargs) -> None:
         """Update DHT-related status for all MAC addresses"""
@@ -94,14 +208,65 @@ class ThermostatObject:
 
         return response
 
+    def get_status_json(self) -> str:
+        """
+        get_status() encoded as a JSON response body, re-encoded only when one of its values changed.
+        Status is polled far more often than it changes, so most requests skip building and encoding it.
+        """
+        key: tuple[Any, ...] = (
+            self.target_heating_cooling_state,
+            self.target_temperature,
+            self.current_heating_cooling_state,
+            self.current_temperature,
+            self.current_relative_humidity,
+            self.dht_connected,
+        )
+        cached: tuple[tuple[Any, ...], str] | None = self._status_json
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        body: str = json.dumps(self.get_status(), ensure_ascii=False, separators=(',', ':')) + "\n"
+        self._status_json = (key, body)
+        return body
+
+    def poll_due(self) -> bool:
+        """Whether a scheduled poll should run, or be skipped while backing off or idle"""
+        now: float = monotonic()
+        return now >= self._poll_backoff_until and now >= self._poll_idle_until
+
+    def _update_poll_idle(self, changed: bool, now: float) -> None:
+        """Poll a thermostat whose state keeps changing at full rate, and an idle one progressively slower"""
+        if changed:
+            self._poll_idle = 0.0
+            self._poll_idle_until = 0.0
+            return
+        self._poll_idle = min(max(self._poll_idle * 1.5, _POLL_IDLE_MIN), _POLL_IDLE_MAX)
+        self._poll_idle_until = now + self._poll_idle
+
+    def update_poll_backoff(self) -> None:
+        """Grow the scheduled-poll backoff after a failed poll, or reset it after a successful one"""
+        if not self.failed_connection:
+            self._poll_backoff = 0.0
+            self._poll_backoff_until = 0.0
+            return
+        self._poll_backoff = min(max(self._poll_backoff * 2, _POLL_BACKOFF_MIN), _POLL_BACKOFF_MAX)
+        self._poll_backoff_until = monotonic() + self._poll_backoff
+        logger.debug("Polling: backing off %.0fs for %s", self._poll_backoff, self.mac)
+
     async def safe_connect(self) -> None:
         """Safely connect to thermostat"""
         try:
-            await self.equiva_thermostat.connect()
+            # Connect one thermostat at a time; the timeout covers the attempt, not the wait for the lock
+            async with _hold(_adapter_lock, "BLE adapter"):
+                await asyncio.wait_for(self.equiva_thermostat.connect(), timeout=CONNECT_TIMEOUT)
             # Connection successful, reset failed connection flag
             if self.failed_connection:
                 logger.info(f"Connection recovered for {self.mac}")
                 self.failed_connection = False
+        except asyncio.TimeoutError as e:
+            # A busy adapter lock says so; connect() timing out leaves the message empty
+            logger.error(f"Failed to connect to {self.mac}: {str(e) or f'no response within {CONNECT_TIMEOUT}s'}")
+            self.failed_connection = True
+            raise
         except Exception as e:
             logger.error(f"Failed to connect to {self.mac}: {e}")
             self.failed_connection = True
@@ -116,33 +281,51 @@ class ThermostatObject:
         except Exception as e:
             logger.error(f"Error disconnecting from {self.equiva_thermostat.address}: {e}")
 
-    async def poll_status(self) -> None:
-        """Poll thermostat status"""
-        try:
-            logger.debug(f"Polling: Attempting to connect to {self.mac}")
-            await self.safe_connect()
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[None]:
+        """Connect for the duration of the block, always disconnecting afterwards"""
+        async with _hold(_device_lock(self.mac), f"BLE session for {self.mac}"):
+            try:
+                await self.safe_connect()
+                yield
+            finally:
+                await self.safe_disconnect()
 
-            logger.debug(f"Polling: Connected to {self.mac}")
-            await self.equiva_thermostat.requestStatus()
-            logger.debug(f"Polling: Status requested from {self.mac}")
+    async def poll_status(self, max_age: float = 0.0) -> None:
+        """
+        Poll thermostat status.
+        With max_age, a status polled successfully less than max_age seconds ago is kept instead.
+        """
+        last_poll: float | None = self._last_poll_monotonic
+        if max_age > 0 and last_poll is not None and monotonic() - last_poll < max_age:
+            logger.debug("Polling: status of %s is fresh, skipping BLE poll", self.mac)
+            return
+        try:
+            logger.debug("Polling: Attempting to connect to %s", self.mac)
+            async with self._session():
+                logger.debug("Polling: Connected to %s", self.mac)
+                await asyncio.wait_for(self.equiva_thermostat.requestStatus(), timeout=REQUEST_TIMEOUT)
+                logger.debug("Polling: Status requested from %s", self.mac)
 
-            mode_obj = self.equiva_thermostat.mode
-            if mode_obj is None:
-                raise EqivaException("Thermostat mode was not returned")
+                mode_obj = self.equiva_thermostat.mode
+                if mode_obj is None:
+                    raise EqivaException("Thermostat mode was not returned")
 
-            temperature_obj = self.equiva_thermostat.temperature
-            if temperature_obj is None or temperature_obj.valueC is None:
-                raise EqivaException("Thermostat temperature was not returned")
+                temperature_obj = self.equiva_thermostat.temperature
+                if temperature_obj is None or temperature_obj.valueC is None:
+                    raise EqivaException("Thermostat temperature was not returned")
 
-            mode: list[str] = mode_obj.to_dict()
-            valve: int | None = self.equiva_thermostat.valve
-            temp: float = temperature_obj.valueC
+                mode: list[str] = mode_obj.to_dict()
+                valve: int | None = self.equiva_thermostat.valve
+                temp: float = temperature_obj.valueC
 
-            target_mode_status = self.calculate_heating_cooling_state(mode)
-            current_mode_status = self.calculate_heating_cooling_state(mode, valve)
+                target_mode_status = self.calculate_heating_cooling_state(mode)
+                current_mode_status = self.calculate_heating_cooling_state(mode, valve)
 
-            if self.target_heating_cooling_state != target_mode_status["int"] or \
-                self.current_heating_cooling_state != current_mode_status["int"]:
+                mode_changed: bool = self.target_heating_cooling_state != target_mode_status["int"] or \
+                    self.current_heating_cooling_state != current_mode_status["int"]
+                changed: bool = mode_changed or self.target_temperature != temp
+                if mode_changed:
                     logger.info(
                         f"Status changed for {self.mac}: "
                         f"targetMode: {target_mode_status['str']}, "
@@ -150,27 +333,22 @@ class ThermostatObject:
                         f"targetTemp: {temp}C"
                     )
 
-            self.target_heating_cooling_state = target_mode_status["int"]
-            self.target_temperature = temp
-            self.current_heating_cooling_state = current_mode_status["int"]
-            self.last_updated = strftime("%Y-%m-%d %H:%M:%S", localtime())
+                self.target_heating_cooling_state = target_mode_status["int"]
+                self.target_temperature = temp
+                self.current_heating_cooling_state = current_mode_status["int"]
+                self.last_updated = _now_str()
+                self._last_poll_monotonic = monotonic()
+                self._update_poll_idle(changed, self._last_poll_monotonic)
 
-            logger.debug(
-                f"Polling: Status changed for {self.mac}: "
-                f"targetMode: {target_mode_status['str']}, "
-                f"currentMode: {current_mode_status['str']}, "
-                f"targetTemp: {self.target_temperature}C"
+                logger.debug(
+                    "Polling: Status changed for %s: targetMode: %s, currentMode: %s, targetTemp: %sC",
+                    self.mac, target_mode_status['str'], current_mode_status['str'], self.target_temperature
                 )
 
         except Exception as e:
             logger.error(f"Polling failed for {self.mac}: {e}")
             self.failed_connection = True
             raise
-        finally:
-            try:
-                await self.safe_disconnect()
-            except Exception as e:
-                logger.error(f"Error disconnecting from {self.mac}: {e}")
 
     async def set_temperature(self, temp: str) -> dict[str, Any]:
         """Set thermostat target temperature"""
@@ -179,10 +357,11 @@ class ThermostatObject:
             return {"result": "error", "message": "Temperature value is required"}
         try:
             logger.info(f"Set temperature for {mac} to {temp}")
-            await self.safe_connect()
-            await self.equiva_thermostat.setTemperature(temperature=Temperature(valueC=float(temp)))
-            self.target_temperature = float(temp)
-            return {"result": "ok", "temperature": float(temp)}
+            async with self._session():
+                await self.equiva_thermostat.setTemperature(temperature=Temperature(valueC=float(temp)))
+                self.target_temperature = float(temp)
+                self._update_poll_idle(True, monotonic())
+                return {"result": "ok", "temperature": float(temp)}
         except BleakError:
             logger.error(f"Device with address {mac} was not found")
             self.failed_connection = True
@@ -198,11 +377,6 @@ class ThermostatObject:
             logger.error(f"Unexpected error for {mac}: {str(ex)}")
             self.failed_connection = True
             return {"result": "error", "message": "Connection failed"}
-        finally:
-            try:
-                await self.safe_disconnect()
-            except Exception as e:
-                logger.error(f"Error disconnecting from {mac}: {e}")
 
     async def set_mode(self, mode: str) -> dict[str, Any]:
         """Set thermostat heating/cooling mode"""
@@ -210,21 +384,22 @@ class ThermostatObject:
         if not mode:
             return {"result": "error", "message": "Mode value is required"}
         try:
-            await self.safe_connect()
-            if mode == '0':
-                await self.equiva_thermostat.setTemperatureOff()
-                self.target_heating_cooling_state = 0
-            elif mode in ('1', '2'):
-                await self.equiva_thermostat.setModeManual()
-                self.target_heating_cooling_state = 1
-            elif mode == '3':
-                await self.equiva_thermostat.setModeAuto()
-                self.target_heating_cooling_state = 3
-            else:
-                return {"result": "error", "message": "Invalid mode value"}
-            mode_str = 'off' if mode == '0' else 'heating' if mode == '1' else 'auto' if mode == '3' else 'unknown'
-            logger.info(f"Set mode for {mac} to {mode_str}")
-            return {"result": "ok", "mode": int(mode)}
+            async with self._session():
+                if mode == '0':
+                    await self.equiva_thermostat.setTemperatureOff()
+                    self.target_heating_cooling_state = 0
+                elif mode in ('1', '2'):
+                    await self.equiva_thermostat.setModeManual()
+                    self.target_heating_cooling_state = 1
+                elif mode == '3':
+                    await self.equiva_thermostat.setModeAuto()
+                    self.target_heating_cooling_state = 3
+                else:
+                    return {"result": "error", "message": "Invalid mode value"}
+                self._update_poll_idle(True, monotonic())
+                mode_str = 'off' if mode == '0' else 'heating' if mode == '1' else 'auto' if mode == '3' else 'unknown'
+                logger.info(f"Set mode for {mac} to {mode_str}")
+                return {"result": "ok", "mode": int(mode)}
         except BleakError:
             logger.error(f"Device with address {mac} was not found")
             self.failed_connection = True
@@ -237,11 +412,6 @@ class ThermostatObject:
             logger.error(f"Unexpected error for {mac}: {str(ex)}")
             self.failed_connection = True
             return {"result": "error", "message": "Connection failed"}
-        finally:
-            try:
-                await self.safe_disconnect()
-            except Exception as e:
-                logger.error(f"Error disconnecting from {mac}: {e}")
 
     def get_all_data(self) -> dict[str, Any]:
         """Get all thermostat data"""
@@ -7,6 +7,9 @@ import logManager
 
 logger: logging.Logger = logManager.logger.get_logger(__name__)
 
+# Size of the precomputed DummyDHT sample ring (power of two so the index can be masked)
+_DUMMY_DHT_SAMPLES: int = 256
+
 
 class DummyGPIO:
     """Dummy GPIO class for simulating GPIO operations without hardware."""
@@ -18,6 +21,9 @@ class DummyGPIO:
     PUD_UP: str = "PUD_UP"
     PUD_DOWN: str = "PUD_DOWN"
     PUD_OFF: str = "PUD_OFF"
+    RISING: int = 31
+    FALLING: int = 32
+    BOTH: int = 33
 
     @staticmethod
     def setwarnings(_state: bool) -> None:
@@ -44,12 +50,27 @@ class DummyGPIO:
     def cleanup(_channel: int | list[int] | tuple[int, ...] = -666) -> None:
         """Dummy cleanup"""
 
+    @staticmethod
+    def add_event_detect(_pin: int, _edge: int, callback: Any = None, bouncetime: int = 0) -> None:
+        """Dummy add_event_detect, never fires"""
+
+    @staticmethod
+    def remove_event_detect(_pin: int) -> None:
+        """Dummy remove_event_detect"""
+
 class DummyDHT:
     """Dummy DHT class for simulating DHT sensor operations without hardware."""
+    __slots__ = ("sensor_type", "_temperatures", "_humidities", "_index")
 
     def __init__(self, sensor_type="DHT22"):
         logger.warning("Using DummyDHT")
         self.sensor_type = sensor_type
+        # Precompute mock readings once and cycle through them on each access
+        self._temperatures: tuple[float, ...] = tuple(
+            random.uniform(5.0, 30.0) for _ in range(_DUMMY_DHT_SAMPLES))
+        self._humidities: tuple[float, ...] = tuple(
+            random.uniform(0.0, 100.0) for _ in range(_DUMMY_DHT_SAMPLES))
+        self._index: int = 0
 
     @staticmethod
     def read_retry(_sensor: int, _pin: int) -> tuple[float, float]:
@@ -88,12 +109,14 @@ class DummyDHT:
     @property
     def temperature(self):
         """Return mock temperature with some variation"""
-        return random.uniform(5.0, 30.0)  # Simulate a temperature reading
+        self._index = (self._index + 1) & (_DUMMY_DHT_SAMPLES - 1)
+        return self._temperatures[self._index]
 
     @property
     def humidity(self):
         """Return mock humidity with some variation"""
-        return random.uniform(0.0, 100.0)  # Simulate a humidity reading
+        # Paired with the last temperature sample, like a single sensor capture
+        return self._humidities[self._index]
 
     def getReal(self): # pylint: disable=invalid-name
         """Return the real adafruit_dht module if available, otherwise use the dummy class"""
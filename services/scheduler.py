@@ -3,7 +3,6 @@ This module provides a scheduler service that runs in the background.
 """
 from datetime import datetime
 from threading import Event
-from time import sleep
 from typing import Any
 import logging
 
@@ -15,16 +14,16 @@ from services import update_manager
 SERVER_CONFIG: dict[str, Any] = config_manager.SERVER_CONFIG.yaml_config
 logger: logging.Logger = logManager.logger.get_logger(__name__)
 
-# Scheduler state flag
-_SCHEDULER_RUNNING: Event = Event()
+# Set to stop the scheduler; also used as its interruptible one-second tick
+_SCHEDULER_STOP: Event = Event()
 
 def run_scheduler() -> None:
     """
     Run the scheduler to process schedules, behavior instances, and smart scenes.
     """
-    _SCHEDULER_RUNNING.set()
+    _SCHEDULER_STOP.clear()
 
-    while _SCHEDULER_RUNNING.is_set():
+    while not _SCHEDULER_STOP.is_set():
 
         if "updatetime" not in SERVER_CONFIG["config"]["swupdate2"]["autoinstall"]:
             SERVER_CONFIG["config"]["swupdate2"]["autoinstall"]["updatetime"] = "T14:00:00"
@@ -36,11 +35,11 @@ def run_scheduler() -> None:
             config_manager.SERVER_CONFIG.save_config()
             if datetime.now().strftime("%H") == "23" and datetime.now().strftime("%A") == "Sunday":
                 config_manager.SERVER_CONFIG.save_config(backup=True)
-        sleep(1)
+        _SCHEDULER_STOP.wait(1)
 
 def stop_scheduler() -> None:
     """
     Stop the scheduler gracefully.
     """
     logger.info("Stopping scheduler...")
-    _SCHEDULER_RUNNING.clear()
+    _SCHEDULER_STOP.set()
@@ -12,7 +12,7 @@ import logManager
 
 import config_manager
 from server_objects.dht_object import DHTObject
-from server_objects.thermostat_object import ThermostatObject
+from server_objects.thermostat_object import CONNECT_TIMEOUT, REQUEST_TIMEOUT, ThermostatObject
 from server_objects.fan_object import FanObject
 from server_objects.klok_object import KlokObject
 from server_objects.powerbutton_object import PowerButtonObject
@@ -28,6 +28,9 @@ _fan_shutdown = threading.Event()
 _klok_shutdown = threading.Event()
 _powerbutton_shutdown = threading.Event()
 
+# Upper bound on a blocking wait for a button press, so a stopped service is noticed even without wake()
+_POWERBUTTON_IDLE_WAIT: float = 1.0
+
 # Async event/loop state for thermostat shutdown
 _thermostat_async_state: dict[str, Any] = {
     "shutdown_event": asyncio.Event(),
@@ -41,6 +44,36 @@ def _ensure_async_event_loop():
         _thermostat_async_state["shutdown_event"] = asyncio.Event()
         _thermostat_async_state["shutdown_loop"] = current_loop
 
+async def _poll_thermostat(thermostat: ThermostatObject) -> None:
+    """
+    Poll one thermostat; poll_status() disconnects on its own when it is done.
+    Unreachable thermostats are skipped with exponential backoff so they do not hog the BLE adapter.
+    """
+    if not thermostat.poll_due():
+        logger.debug("Polling: skipping %s, backing off or idle", thermostat.mac)
+        return
+    try:
+        logger.debug("fetch %s", thermostat.mac)
+        await thermostat.poll_status()
+        thermostat.failed_connection = False
+    except BleakError as e:
+        logger.error(f"Polling: BLE error for {thermostat.mac}: {e}")
+        thermostat.failed_connection = True
+    except EqivaException as e:
+        logger.error(f"Polling: EqivaException for {thermostat.mac}: {e}")
+        thermostat.failed_connection = True
+    except asyncio.TimeoutError as e:
+        if str(e):
+            # Waiting for a busy BLE lock; the message names the lock
+            logger.error("Polling: Timed out polling %s: %s", thermostat.mac, e)
+        else:
+            # str() of a wait_for TimeoutError is empty, so log the limits instead
+            logger.error("Polling: Timed out polling %s after %ss connect / %ss status limit",
+                         thermostat.mac, CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+        thermostat.failed_connection = True
+    finally:
+        thermostat.update_poll_backoff()
+
 async def sync_with_thermostats() -> None:
     """
     Synchronize the state of the thermostats with their actual state.
@@ -51,26 +84,16 @@ async def sync_with_thermostats() -> None:
         logger.debug("start thermostats sync")
         interval: int = SERVER_CONFIG["config"]["thermostats"]["interval"]
 
-        for thermostat in SERVER_CONFIG["thermostats"].values():
-            if _thermostat_shutdown.is_set():
-                break
-            thermostat: ThermostatObject = thermostat
-            try:
-                logger.debug("fetch " + thermostat.mac)
-                await thermostat.poll_status()
-                thermostat.failed_connection = False
-            except BleakError as e:
-                logger.error(f"Polling: BLE error for {thermostat.mac}: {e}")
+        # Poll all thermostats concurrently so their BLE round-trips overlap instead of adding up
+        thermostats: list[ThermostatObject] = list(SERVER_CONFIG["thermostats"].values())
+        results: list[Any] = await asyncio.gather(
+            *(_poll_thermostat(thermostat) for thermostat in thermostats),
+            return_exceptions=True
+        )
+        for thermostat, result in zip(thermostats, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Polling: Unexpected error for {thermostat.mac}: {result}")
                 thermostat.failed_connection = True
-            except EqivaException as e:
-                logger.error(f"Polling: EqivaException for {thermostat.mac}: {e}")
-                thermostat.failed_connection = True
-            finally:
-                try:
-                    await thermostat.safe_disconnect()
-                    logger.debug(f"Polling: Disconnected from {thermostat.mac}")
-                except Exception as e:
-                    logger.error(f"Polling: Error disconnecting from {thermostat.mac}: {e}")
 
         # Simple sleep with shutdown check - much more efficient
         sleep_time: float = max(10, interval)
@@ -151,7 +174,7 @@ def run_dht_service() -> None:
         try:
             dht: DHTObject = SERVER_CONFIG["dht"]
             if dht:
-                dht.read_dht_temperature()
+                dht.read_dht_temperature(_dht_shutdown)
         except Exception as e:
             logger.error(f"Error reading DHT temperature: {e}")
 
@@ -166,16 +189,21 @@ def run_fan_service() -> None:
     This function should be implemented to control the fan based on temperature.
     """
     while SERVER_CONFIG["config"]["fan"]["enabled"] and not _fan_shutdown.is_set() and SERVER_CONFIG.get("fan"):
-        interval: int = SERVER_CONFIG["config"]["fan"]["interval"]
+        interval: float = max(5, SERVER_CONFIG["config"]["fan"]["interval"])
+        # Each fan may stretch the wait while its temperature is stable; the most active fan wins
+        wait_time: float | None = None
         try:
             for fan in list(SERVER_CONFIG["fan"].values()):
                 fan: FanObject = fan
                 fan.run()
+                fan_interval: float = fan.next_interval(interval)
+                wait_time = fan_interval if wait_time is None else min(wait_time, fan_interval)
         except Exception as e:
             logger.error(f"Error in fan service: {e}")
+            wait_time = interval
 
         # Use event.wait() instead of sleep loops for immediate shutdown
-        if _fan_shutdown.wait(timeout=max(5, interval)):
+        if _fan_shutdown.wait(timeout=interval if wait_time is None else wait_time):
             # Event was set - shutdown requested
             break
 
@@ -199,15 +227,18 @@ def run_klok_service() -> None:
     This function should be implemented to update the klok display.
     """
     while SERVER_CONFIG["config"]["klok"]["enabled"] and not _klok_shutdown.is_set() and "klok" in SERVER_CONFIG:
+        wait_time: float = 0.1
         try:
             klok: KlokObject = SERVER_CONFIG["klok"]
             if klok:
                 klok.show()
+                # Sleep until the next doublepoint toggle instead of waking every 0.1s
+                wait_time = klok.seconds_until_next_update()
         except Exception as e:
             logger.error(f"Error in klok service: {e}")
 
-        # Use event.wait() with shorter timeout for responsive doublepoint updates
-        if _klok_shutdown.wait(timeout=0.1):
+        # Use event.wait() instead of sleep loops for immediate shutdown
+        if _klok_shutdown.wait(timeout=wait_time):
             # Event was set - shutdown requested
             break
 
@@ -231,15 +262,19 @@ def run_powerbutton_service() -> None:
     This function should be implemented to handle power button events.
     """
     while SERVER_CONFIG["config"]["powerbutton"]["enabled"] and not _powerbutton_shutdown.is_set() and "powerbutton" in SERVER_CONFIG:
+        poll_wait: float = 0.1
         try:
             powerbutton: PowerButtonObject = SERVER_CONFIG["powerbutton"]
             if powerbutton:
                 powerbutton.run()
+                # With edge detection, sleep until a press is latched; only the polling fallback wakes at 10 Hz
+                if powerbutton.wait_for_press(_POWERBUTTON_IDLE_WAIT):
+                    poll_wait = 0.0
         except Exception as e:
             logger.error(f"Error in power button service: {e}")
 
         # Use event.wait() instead of sleep for immediate shutdown
-        if _powerbutton_shutdown.wait(timeout=0.1):
+        if _powerbutton_shutdown.wait(timeout=poll_wait):
             # Event was set - shutdown requested
             break
 
@@ -287,4 +322,7 @@ def stop_all_services() -> None:
     _fan_shutdown.set()
     _klok_shutdown.set()
     _powerbutton_shutdown.set()
+    powerbutton: PowerButtonObject | None = SERVER_CONFIG.get("powerbutton")
+    if powerbutton:
+        powerbutton.wake()
     logger.info("All stateFetch services shutdown events set.")
@@ -1,7 +1,7 @@
 """Driver for TM1637 four-digit seven-segment LED display."""
 import math
 import time
-from typing import Any, cast
+from typing import Any, Sequence, cast
 try:
     import RPi.GPIO as IO  # type: ignore
 except (ImportError, RuntimeError):
@@ -61,10 +61,10 @@ class TM1637:
         self.__brightness = b
         self.__double_point = point
 
-    def show(self, data: list[int]) -> None:
+    def show(self, data: Sequence[int]) -> None:
         """
         Show the data on the display.
-        Data should be a list of 4 integers (0-15) or 0x7F for blank.
+        Data should be a sequence of 4 integers (0-15) or 0x7F for blank.
         """
         for i in range(0, 4):
             self.__current_data[i] = data[i]
@@ -88,6 +88,15 @@ class TM1637:
             self.__brightness = brightness
             self.show(self.__current_data)
 
+    def show_all(self, data: Sequence[int], percent: float, double_point: bool) -> None:
+        """
+        Show the digits, double point and brightness (0 - 1) in a single transaction.
+        Every frame already carries all three, so this replaces separate show/brightness/double point writes.
+        """
+        self.__brightness = max(math.ceil(7.0 * percent), 0)
+        self.__double_point = double_point
+        self.show(data)
+
     def show_double_point(self, on: bool) -> None:
         """Show or hide double point divider"""
         if self.__double_point != on:
@@ -96,30 +105,31 @@ class TM1637:
 
     def write_byte(self, data: int) -> None:
         """Write a byte to the display."""
+        # Every bit is a few GPIO calls, so keep the lookups out of the per-bit loop
+        output = IO.output
+        clk_pin: int = self.__clk_pin
+        data_pin: int = self.__data_pin
         for _ in range(0, 8):
-            IO.output(self.__clk_pin, GPIO_LOW)
-            if data & 0x01:
-                IO.output(self.__data_pin, GPIO_HIGH)
-            else:
-                IO.output(self.__data_pin, GPIO_LOW)
+            output(clk_pin, GPIO_LOW)
+            output(data_pin, GPIO_HIGH if data & 0x01 else GPIO_LOW)
             data = data >> 1
-            IO.output(self.__clk_pin, GPIO_HIGH)
+            output(clk_pin, GPIO_HIGH)
 
         # wait for ACK
-        IO.output(self.__clk_pin, GPIO_LOW)
-        IO.output(self.__data_pin, GPIO_HIGH)
-        IO.output(self.__clk_pin, GPIO_HIGH)
-        IO.setup(self.__data_pin, GPIO_IN)
+        output(clk_pin, GPIO_LOW)
+        output(data_pin, GPIO_HIGH)
+        output(clk_pin, GPIO_HIGH)
+        IO.setup(data_pin, GPIO_IN)
 
         # Add timeout to prevent infinite blocking
-        timeout = time.time() + 0.1  # 100ms timeout
-        while IO.input(self.__data_pin) and time.time() < timeout:
+        timeout = time.monotonic() + 0.1  # 100ms timeout
+        while IO.input(data_pin) and time.monotonic() < timeout:
             sleep(0.001)
-            if IO.input(self.__data_pin):
-                IO.setup(self.__data_pin, GPIO_OUT)
-                IO.output(self.__data_pin, GPIO_LOW)
-                IO.setup(self.__data_pin, GPIO_IN)
-        IO.setup(self.__data_pin, GPIO_OUT)
+            if IO.input(data_pin):
+                IO.setup(data_pin, GPIO_OUT)
+                output(data_pin, GPIO_LOW)
+                IO.setup(data_pin, GPIO_IN)
+        IO.setup(data_pin, GPIO_OUT)
 
     def start(self) -> None:
         """send start signal to TM1637"""
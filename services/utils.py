@@ -2,11 +2,26 @@
 Utility functions for the API
 """
 import asyncio
-from functools import wraps
+from functools import cache, wraps
+import hmac
 import subprocess
 import os
+import re
+import threading
+from time import monotonic
 from typing import Any, Callable
 
+from werkzeug.security import check_password_hash
+
+# Seconds a CPU temperature reading is reused before sysfs is read again
+_PI_TEMP_TTL: float = 0.2
+_pi_temp_lock = threading.Lock()
+# Last successful reading and when it was taken
+_pi_temp_cache: dict[str, Any] = {
+    "timestamp": float("-inf"),
+    "temp": None,
+}
+
 
 def async_route(f: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to handle async functions in Flask routes"""
@@ -21,50 +36,91 @@ def async_route(f: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
-def validate_mac_address(mac: str) -> bool:
-    """Validate MAC address format"""
-    if not mac:
-        return False
-    formatted_mac: str = format_mac(mac)
-    # Basic MAC validation - should be 6 groups of 2 hex digits
-    parts: list[str] = formatted_mac.split(':')
-    if len(parts) != 6:
+# Successful password checks, keyed on (stored hash, HMAC of the password) and cleared once full
+_VERIFIED_MAX: int = 128
+_verified_key: bytes = os.urandom(32)
+_verified: dict[tuple[str, bytes], bool] = {}
+
+def verify_password(stored_hash: str, password: str) -> bool:
+    """
+    check_password_hash with a small cache of successful verifications.
+    Keyed on the stored hash and an HMAC of the password, never the password itself,
+    so a changed password in the config invalidates its entries automatically.
+    """
+    key: tuple[str, bytes] = (stored_hash, hmac.new(_verified_key, password.encode(), 'sha256').digest())
+    if key in _verified:
+        return True
+    if not check_password_hash(stored_hash, password):
         return False
-    for part in parts:
-        if len(part) != 2 or not all(c in '0123456789ABCDEF' for c in part):
-            return False
+    if len(_verified) >= _VERIFIED_MAX:
+        _verified.clear()
+    _verified[key] = True
     return True
 
 
+# Six hex pairs separated by ':' or '-', matched in one pass
+_MAC_RE: re.Pattern[str] = re.compile(r'[0-9A-Fa-f]{2}(?:[:-][0-9A-Fa-f]{2}){5}')
+
+def normalize_mac(mac: str) -> str | None:
+    """Return the MAC address in standard format, or None if it is not a valid MAC address"""
+    if _MAC_RE.fullmatch(mac) is None:
+        return None
+    return format_mac(mac)
+
+
 def format_mac(mac: str) -> str:
     """Format MAC address to standard format"""
     return mac.replace('-', ':').upper()
 
 
 def get_pi_temp() -> float:
+    """
+    Return the CPU temperature in degrees Celsius.
+    Readings are cached briefly so the fan loop and the system routes share one sysfs read.
+    """
+    with _pi_temp_lock:
+        now: float = monotonic()
+        if now - _pi_temp_cache["timestamp"] < _PI_TEMP_TTL:
+            return _pi_temp_cache["temp"]
+        temp: float = _read_pi_temp()
+        _pi_temp_cache["timestamp"] = now
+        _pi_temp_cache["temp"] = temp
+        return temp
+
+@cache
+def _cpu_temp_file() -> str | None:
+    """Return the temp file of the thermal zone matching a known CPU sensor type, looked up once"""
+    base_path = "/sys/class/thermal"
+    if not os.path.exists(base_path):
+        return None
+    temp_zones = ["x86_pkg_temp", "cpu-thermal", "soc_thermal", "coretemp"]
+    for folder in sorted(os.listdir(base_path)):
+        if folder.startswith("thermal_zone"):
+            zone_path = os.path.join(base_path, folder)
+            type_file = os.path.join(zone_path, "type")
+            temp_file = os.path.join(zone_path, "temp")
+
+            if os.path.exists(type_file) and os.path.exists(temp_file):
+                with open(type_file, "r", encoding="utf-8") as f:
+                    zone_type = f.read().strip().lower()
+                if any(kw in zone_type for kw in temp_zones):
+                    return temp_file
+    return None
+
+def _read_pi_temp() -> float:
     """Read the CPU temperature and return it as a float in degrees Celsius."""
     base_path = "/sys/class/thermal"
 
-    if os.path.exists(base_path):
-        # Search for a thermal zone matching known CPU sensor type names
-        for folder in os.listdir(base_path):
-            if folder.startswith("thermal_zone"):
-                zone_path = os.path.join(base_path, folder)
-                type_file = os.path.join(zone_path, "type")
-                temp_file = os.path.join(zone_path, "temp")
-
-                if os.path.exists(type_file) and os.path.exists(temp_file):
-                    with open(type_file, "r", encoding="utf-8") as f:
-                        zone_type = f.read().strip().lower()
-
-                    temp_zones = ["x86_pkg_temp", "cpu-thermal", "soc_thermal", "coretemp"]
-                    if any(kw in zone_type for kw in temp_zones):
-                        with open(temp_file, "r", encoding="utf-8") as tf:
-                            try:
-                                return round(float(tf.read().strip()) / 1000.0, 2)
-                            except ValueError:
-                                continue
+    # The CPU zone does not move at runtime, so only its temp file is read on each call
+    temp_file: str | None = _cpu_temp_file()
+    if temp_file is not None:
+        try:
+            with open(temp_file, "r", encoding="utf-8") as tf:
+                return round(float(tf.read().strip()) / 1000.0, 2)
+        except (OSError, ValueError):
+            pass
 
+    if os.path.exists(base_path):
         # Fallback: return the highest plausible temperature zone
         highest_temp = -1.0
         for folder in os.listdir(base_path):
@@ -0,0 +1,40 @@
+"""
+Tests for the cached password verification used by the Flask-Login request loader
+"""
+import unittest
+
+from werkzeug.security import generate_password_hash
+
+from services.utils import verify_password
+
+
+class VerifyPasswordTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stored_hash: str = generate_password_hash("correct horse")
+
+    def test_correct_password_is_accepted(self) -> None:
+        self.assertTrue(verify_password(self.stored_hash, "correct horse"))
+
+    def test_wrong_password_is_rejected(self) -> None:
+        self.assertFalse(verify_password(self.stored_hash, "battery staple"))
+
+    def test_wrong_password_is_rejected_after_correct_one_is_cached(self) -> None:
+        self.assertTrue(verify_password(self.stored_hash, "correct horse"))
+        self.assertTrue(verify_password(self.stored_hash, "correct horse"))
+        self.assertFalse(verify_password(self.stored_hash, "battery staple"))
+        self.assertFalse(verify_password(self.stored_hash, ""))
+
+    def test_rejected_password_stays_rejected(self) -> None:
+        self.assertFalse(verify_password(self.stored_hash, "battery staple"))
+        self.assertFalse(verify_password(self.stored_hash, "battery staple"))
+        self.assertTrue(verify_password(self.stored_hash, "correct horse"))
+
+    def test_changed_hash_invalidates_cached_password(self) -> None:
+        self.assertTrue(verify_password(self.stored_hash, "correct horse"))
+        new_hash: str = generate_password_hash("battery staple")
+        self.assertFalse(verify_password(new_hash, "correct horse"))
+        self.assertTrue(verify_password(new_hash, "battery staple"))
+
+
+if __name__ == "__main__":
+    unittest.main()
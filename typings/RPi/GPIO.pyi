@@ -1,4 +1,5 @@
 """Stub for RPi.GPIO - provides BCM pin naming conventions and GPIO control."""
+from typing import Callable
 
 # Pin numbering modes
 BCM: str
@@ -17,6 +18,11 @@ PUD_UP: str
 LOW: int
 HIGH: int
 
+# Edge detection
+RISING: int
+FALLING: int
+BOTH: int
+
 # Functions
 def setwarnings(state: bool) -> None: ...
 def setmode(mode: str) -> None: ...
@@ -24,3 +30,7 @@ def setup(pin: int, mode: str, pull_up_down: str = ...) -> None: ...
 def output(pin: int, state: int) -> None: ...
 def input(pin: int) -> int: ...
 def cleanup(channel: int | list[int] | tuple[int, ...] | None = ...) -> None: ...
+def add_event_detect(
+    channel: int, edge: int, callback: Callable[[int], None] | None = ..., bouncetime: int = ...
+) -> None: ...
+def remove_event_detect(channel: int) -> None: ...